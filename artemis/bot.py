@@ -4,21 +4,36 @@ Copyright 2025, Vijay Challa - Use of this source code follows the MIT license f
 Core Artemis Bot class
 """
 
+import asyncio
 import disnake
 from disnake.ext import commands
-from typing import Optional
+from typing import FrozenSet, Optional, Sequence, Union
 import logging
+import time
 from dataclasses import dataclass
 
 from artemis.storage.json_store import JSONStore
 from artemis.events.manager import EventManager
 from artemis.plugin.loader import PluginLoader
+from artemis.plugin.base import PluginHelper
 from artemis.commands.parser import CommandParser
+from artemis.utils.helpers import set_command_prefixes
 
 logger = logging.getLogger("artemis.bot")
 
+_ACTIVITY_TYPE_MAP = {
+    'playing': disnake.ActivityType.playing,
+    'watching': disnake.ActivityType.watching,
+    'listening': disnake.ActivityType.listening,
+    'streaming': disnake.ActivityType.streaming,
+    'competing': disnake.ActivityType.competing
+}
 
-@dataclass
+# Gateway intents requested by the bot (members and message content included)
+_INTENTS = disnake.Intents.all()
+
+
+@dataclass(slots=True)
 class EventData:
     """Data container for event callbacks."""
     message: Optional[disnake.Message] = None
@@ -27,6 +42,50 @@ class EventData:
     artemis: Optional["ArtemisBot"] = None
 
 
+@dataclass(slots=True, frozen=True)
+class ResolvedConfig:
+    """Configuration values resolved once at startup with defaults applied."""
+    storage_dir: str
+    activity_type: Optional[str]
+    activity_text: Optional[str]
+    stream_url: str
+    command_prefix: Union[str, Sequence[str]]
+    bot_token: Optional[str]
+    admin_ids: FrozenSet[int]
+    
+    @classmethod
+    def from_config(cls, config) -> "ResolvedConfig":
+        """Resolve a configuration module/object into a ResolvedConfig."""
+        return cls(
+            storage_dir=getattr(config, 'STORAGE_DIR', 'storage'),
+            activity_type=getattr(config, 'BOT_ACTIVITY_TYPE', None),
+            activity_text=getattr(config, 'BOT_ACTIVITY_TEXT', None),
+            stream_url=getattr(config, 'BOT_STREAM_URL', 'https://twitch.tv'),
+            command_prefix=config.COMMAND_PREFIX,
+            bot_token=getattr(config, 'BOT_TOKEN', None),
+            admin_ids=_resolve_admin_ids(getattr(config, 'ADMIN_USER_IDS', []))
+        )
+
+
+def _resolve_admin_ids(user_ids) -> FrozenSet[int]:
+    """
+    Convert configured admin user IDs to ints, skipping any that aren't numeric.
+    
+    Args:
+        user_ids: ADMIN_USER_IDS from the config (strings or ints)
+        
+    Returns:
+        Set of admin user IDs
+    """
+    admin_ids = set()
+    for user_id in user_ids:
+        try:
+            admin_ids.add(int(user_id))
+        except (TypeError, ValueError):
+            logger.warning(f"Ignoring invalid ADMIN_USER_IDS entry: {user_id!r}")
+    return frozenset(admin_ids)
+
+
 class ArtemisBot(commands.Bot):
     """
     Main bot class extending disnake Bot.
@@ -40,40 +99,71 @@ class ArtemisBot(commands.Bot):
             config: Configuration object
         """
         self.config = config
+        self._cfg = ResolvedConfig.from_config(config)
+        # Admin user IDs as ints for O(1) membership checks
+        self.admin_ids = self._cfg.admin_ids
         
-        intents = disnake.Intents.all()
         super().__init__(
-            command_prefix=config.COMMAND_PREFIX,
-            intents=intents,
+            command_prefix=self._cfg.command_prefix,
+            intents=_INTENTS,
             help_command=None
         )
         
-        storage_dir = getattr(config, 'STORAGE_DIR', 'storage')
-        self.storage = JSONStore(storage_dir)
+        self.storage = JSONStore(self._cfg.storage_dir)
         
         self.eventManager = EventManager(self)
         
         self.plugin_loader = PluginLoader("plugins")
         
-        self.command_parser = CommandParser(config.COMMAND_PREFIX)
+        self.command_parser = CommandParser(self._cfg.command_prefix)
+        # Plugins read their arguments through split_command/arg_substr
+        set_command_prefixes(self._cfg.command_prefix)
+        
+        # Pre-bound methods used on every message
+        self._parse = self.command_parser.parse
+        self._has_listeners = self.eventManager.has_listeners
+        self._dispatch_command = self.eventManager.dispatch_command
+        self._dispatch_event = self.eventManager.dispatch_event
         
         self.log = logger
         
-        import time
         self.startup_time = time.time()
         
+        # Bot's own user ID, set once logged in (see on_ready)
+        self._own_id: Optional[int] = None
+        
+        # Keep PluginHelper's member name index in sync with the member cache.
+        # Registered as extra listeners so plugins overriding on_member_* via
+        # @bot.event don't disable the invalidation
+        self.add_listener(self._invalidate_member_index, "on_member_join")
+        self.add_listener(self._invalidate_member_index, "on_member_remove")
+        self.add_listener(self._on_member_update_index, "on_member_update")
+        self.add_listener(self._on_user_update_index, "on_user_update")
+        self.add_listener(self._on_guild_remove_index, "on_guild_remove")
+        
+        # (status, activity type, activity text) last sent by _set_status
+        self._last_presence: Optional[tuple] = None
+        
+        # Background plugin load started by start(); awaited before events are handled
+        self._plugins_loaded: Optional[asyncio.Future] = None
+        
         logger.info("Artemis bot initialized")
     
     async def setup_hook(self):
         """Called when the bot is about to connect to Discord."""
         await self.change_presence(status=disnake.Status.dnd, activity=None)
+        self._last_presence = None
         logger.info("Bot connecting - status set to busy")
     
     async def on_ready(self):
         """Called when bot is ready."""
         logger.info(f"Bot is ready! Logged in as {self.user}")
+        self._own_id = self.user.id
         logger.info(f"Connected to {len(self.guilds)} guilds")
         
+        await self._wait_for_plugins()
+        self.eventManager.freeze()
+        
         await self._set_status()
         
         # Load all members for all guilds
@@ -86,28 +176,27 @@ class ArtemisBot(commands.Bot):
     
     async def _set_status(self):
         """Set the bot's presence status to online with configured activity."""
-        activity_type = getattr(self.config, 'BOT_ACTIVITY_TYPE', None)
-        activity_text = getattr(self.config, 'BOT_ACTIVITY_TEXT', None)
+        activity_type = self._cfg.activity_type
+        activity_text = self._cfg.activity_text
+        
+        # on_ready fires again after gateway reconnects; skip the presence
+        # update when nothing has changed since the last one
+        presence = (disnake.Status.online, activity_type, activity_text)
+        if presence == self._last_presence:
+            logger.debug("Bot presence unchanged, skipping update")
+            return
         
         activity = None
         if activity_type and activity_text:
-            activity_type_map = {
-                'playing': disnake.ActivityType.playing,
-                'watching': disnake.ActivityType.watching,
-                'listening': disnake.ActivityType.listening,
-                'streaming': disnake.ActivityType.streaming,
-                'competing': disnake.ActivityType.competing
-            }
-            
-            activity_type_enum = activity_type_map.get(activity_type.lower(), disnake.ActivityType.playing)
+            activity_type_enum = _ACTIVITY_TYPE_MAP.get(activity_type.lower(), disnake.ActivityType.playing)
             
             if activity_type_enum == disnake.ActivityType.streaming:
-                stream_url = getattr(self.config, 'BOT_STREAM_URL', 'https://twitch.tv')
-                activity = disnake.Streaming(name=activity_text, url=stream_url)
+                activity = disnake.Streaming(name=activity_text, url=self._cfg.stream_url)
             else:
                 activity = disnake.Activity(type=activity_type_enum, name=activity_text)
         
         await self.change_presence(status=disnake.Status.online, activity=activity)
+        self._last_presence = presence
         
         if activity:
             activity_str = f"{activity_type}: {activity_text}"
@@ -117,29 +206,40 @@ class ArtemisBot(commands.Bot):
     
     async def on_message(self, message: disnake.Message):
         """Handle incoming messages."""
-        if message.author.bot:
+        author = message.author
+        if author.id == self._own_id or author.bot:
             return
         
-        parsed = self.command_parser.parse(message.content)
+        await self._wait_for_plugins()
+        
+        content = message.content
+        parsed = self._parse(content)
         if parsed:
-            logger.info(f"Parsed command: '{parsed.command}' from message: '{message.content}'")
-            event_data = EventData(
-                message=message,
-                guild=message.guild,
-                channel=message.channel,
-                artemis=self
-            )
-            
-            await self.eventManager.dispatch_command(parsed.command, parsed.args, event_data)
+            logger.info("Parsed command: '%s' from message: '%s'", parsed.command, content)
         else:
-            logger.debug(f"Message did not parse as command: {message.content}")
+            logger.debug("Message did not parse as command: %s", content)
+            # Plain chat with nobody listening for "message" needs no dispatch
+            if not self._has_listeners("message"):
+                return
         
-        await self.eventManager.dispatch_event("message", EventData(
+        # Shared by the command and "message" dispatches
+        event_data = EventData(
             message=message,
             guild=message.guild,
             channel=message.channel,
             artemis=self
-        ))
+        )
+        
+        if not parsed:
+            await self._dispatch_event("message", event_data)
+        elif self._has_listeners("message"):
+            # Run the command and "message" listeners concurrently so their
+            # I/O overlaps instead of adding up
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(self._dispatch_command(parsed.command, parsed.args, event_data))
+                tg.create_task(self._dispatch_event("message", event_data))
+        else:
+            await self._dispatch_command(parsed.command, parsed.args, event_data)
     
     async def on_guild_join(self, guild: disnake.Guild):
         """Handle guild join."""
@@ -156,44 +256,69 @@ class ArtemisBot(commands.Bot):
     
     async def on_member_join(self, member: disnake.Member):
         """Handle member join - member is automatically cached by Discord."""
-        logger.debug(f"Member {member.name}#{member.discriminator} joined guild {member.guild.name}")
+        logger.debug("Member %s#%s joined guild %s", member.name, member.discriminator, member.guild.name)
         # Member is automatically cached when they join, no action needed
     
     async def on_member_remove(self, member: disnake.Member):
         """Handle member leave - member will be removed from cache automatically."""
-        logger.debug(f"Member {member.name}#{member.discriminator} left guild {member.guild.name}")
+        logger.debug("Member %s#%s left guild %s", member.name, member.discriminator, member.guild.name)
         # Member will be automatically removed from cache, no action needed
     
     async def on_member_update(self, before: disnake.Member, after: disnake.Member):
         """Handle member update (e.g., role changes) - member is already in cache."""
         if before.roles != after.roles:
-            logger.debug(f"Member {after.name}#{after.discriminator} roles updated in guild {after.guild.name}")
+            logger.debug("Member %s#%s roles updated in guild %s", after.name, after.discriminator, after.guild.name)
             # Member is already in cache, roles are automatically updated
     
+    async def _invalidate_member_index(self, member: disnake.Member):
+        """Drop the cached member name index for a member's guild."""
+        PluginHelper.invalidate_member_index(member.guild.id)
+    
+    async def _on_member_update_index(self, before: disnake.Member, after: disnake.Member):
+        """Drop the member name index when a nickname changes."""
+        if before.display_name != after.display_name:
+            PluginHelper.invalidate_member_index(after.guild.id)
+    
+    async def _on_user_update_index(self, before: disnake.User, after: disnake.User):
+        """Drop all member name indexes when a username changes."""
+        if before.name != after.name or before.discriminator != after.discriminator:
+            PluginHelper.invalidate_member_index()
+    
+    async def _on_guild_remove_index(self, guild: disnake.Guild):
+        """Drop the member name index for a guild the bot left."""
+        PluginHelper.invalidate_member_index(guild.id)
+    
     async def _chunk_all_guilds(self):
         """Chunk (load) all members for all guilds."""
-        for guild in self.guilds:
-            await self._chunk_guild(guild)
+        # Chunk requests are network-bound, so run them concurrently
+        guilds = list(self.guilds)
+        results = await asyncio.gather(*(self._chunk_guild(guild) for guild in guilds), return_exceptions=True)
+        for guild, result in zip(guilds, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error chunking guild {guild.name} ({guild.id}): {result}", exc_info=result)
     
     async def _chunk_guild(self, guild: disnake.Guild):
         """Chunk (load) all members for a specific guild."""
-        try:
-            cached_count = len(guild.members)
-            server_count = guild.member_count or cached_count
-            
-            # Only chunk if we're missing a significant number of members
-            # or if the guild is small enough that we can chunk quickly
-            if cached_count < server_count * 0.9 or server_count < 1000:
-                logger.info(f"Chunking guild {guild.name} ({guild.id}): {cached_count}/{server_count} members cached")
-                try:
-                    await guild.chunk()
-                    logger.info(f"Successfully loaded all members for guild {guild.name} ({guild.id}): {len(guild.members)} members")
-                except Exception as e:
-                    logger.warning(f"Failed to chunk guild {guild.name} ({guild.id}): {e}")
-            else:
-                logger.debug(f"Guild {guild.name} ({guild.id}) already has {cached_count}/{server_count} members cached, skipping chunk")
-        except Exception as e:
-            logger.error(f"Error chunking guild {guild.name} ({guild.id}): {e}")
+        cached_count = len(guild.members)
+        server_count = guild.member_count or cached_count
+        
+        # Nothing to load when every member is already cached
+        if cached_count >= server_count:
+            logger.debug("Guild %s (%s) has all %d members cached, skipping chunk", guild.name, guild.id, cached_count)
+            return
+        
+        # Only chunk if we're missing a significant number of members
+        # (more than 10%) or if the guild is small enough that we can chunk quickly
+        if server_count < 1000 or cached_count * 10 < server_count * 9:
+            logger.info(f"Chunking guild {guild.name} ({guild.id}): {cached_count}/{server_count} members cached")
+            try:
+                await guild.chunk()
+                PluginHelper.invalidate_member_index(guild.id)
+                logger.info(f"Successfully loaded all members for guild {guild.name} ({guild.id}): {len(guild.members)} members")
+            except Exception as e:
+                logger.warning(f"Failed to chunk guild {guild.name} ({guild.id}): {e}")
+        else:
+            logger.debug("Guild %s (%s) already has %d/%d members cached, skipping chunk", guild.name, guild.id, cached_count, server_count)
     
     def load_plugins(self) -> None:
         """Load all plugins."""
@@ -202,11 +327,37 @@ class ArtemisBot(commands.Bot):
         logger.info(f"Loaded {len(self.plugin_loader.loaded_plugins)} plugins")
         logger.info(f"Registered commands: {sorted(self.eventManager.command_listeners.keys())}")
     
+    async def _wait_for_plugins(self) -> None:
+        """Wait for the background plugin load (if still running) to finish, logging if it failed."""
+        loading = self._plugins_loaded
+        if loading is None:
+            return
+        
+        try:
+            await loading
+        except Exception as e:
+            # Every waiter sees the failure; only the first to get here reports it
+            if self._plugins_loaded is loading:
+                logger.error(f"Plugin loading failed: {e}", exc_info=e)
+        finally:
+            # Once the load has finished there is nothing left to wait for
+            if self._plugins_loaded is loading and loading.done():
+                self._plugins_loaded = None
+    
+    async def start(self, *args, **kwargs) -> None:
+        """
+        Start the bot.
+        
+        Plugins are loaded in a worker thread so that importing them overlaps
+        with the gateway login/connect handshake.
+        """
+        loop = asyncio.get_running_loop()
+        self._plugins_loaded = loop.run_in_executor(None, self.load_plugins)
+        await super().start(*args, **kwargs)
+    
     def run(self) -> None:
         """Run the bot."""
-        self.load_plugins()
-        
-        token = self.config.BOT_TOKEN
+        token = self._cfg.bot_token
         if not token or token == "your-bot-token-here":
             logger.error("Bot token not configured! Please set BOT_TOKEN in config/config.py")
             return
@@ -219,11 +370,13 @@ class ArtemisBot(commands.Bot):
         
         try:
             await self.change_presence(status=disnake.Status.invisible, activity=None)
+            self._last_presence = None
             logger.info("Set bot status to offline")
         except Exception as e:
             logger.warning(f"Failed to set offline status: {e}")
         
         self.eventManager.stop_periodic_tasks()
+        await self.storage.flush()
         
         await super().close()
         
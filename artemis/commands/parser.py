@@ -4,13 +4,13 @@ Copyright 2025, Vijay Challa - Use of this source code follows the MIT license f
 Command parser for handling prefix commands
 """
 
-from typing import Optional, Tuple
+import re
+import sys
+from typing import Optional, Sequence, Tuple, Union
 from dataclasses import dataclass
 
-from artemis.utils.helpers import split_command
 
-
-@dataclass
+@dataclass(slots=True)
 class ParsedCommand:
     """Represents a parsed command."""
     command: str
@@ -21,14 +21,28 @@ class ParsedCommand:
 class CommandParser:
     """Parses command messages."""
     
-    def __init__(self, prefix: str = "!"):
+    def __init__(self, prefix: Union[str, Sequence[str]] = "!"):
         """
         Initialize command parser.
         
         Args:
-            prefix: Command prefix
+            prefix: Command prefix, or a sequence of accepted prefixes
         """
         self.prefix = prefix
+        
+        # Multiple prefixes are matched (together with the command name) by a
+        # single compiled pattern; longest prefixes first so "!!" beats "!"
+        self._pattern: Optional[re.Pattern] = None
+        if not isinstance(prefix, str):
+            alternatives = "|".join(re.escape(p) for p in sorted(prefix, key=len, reverse=True))
+            self._pattern = re.compile(rf"(?:{alternatives})\s*(\S+)(.*)", re.DOTALL)
+            prefix = ""
+        
+        self._prefix_len = len(prefix)
+        # Single-character prefixes (the common "!") are checked with a plain
+        # character compare instead of startswith()
+        self._is_single = len(prefix) == 1
+        self._prefix_char = prefix if self._is_single else None
     
     def parse(self, content: str) -> Optional[ParsedCommand]:
         """
@@ -40,15 +54,38 @@ class CommandParser:
         Returns:
             ParsedCommand or None if not a command
         """
-        if not content.startswith(self.prefix):
-            return None
+        if self._pattern is not None:
+            match = self._pattern.match(content)
+            if not match:
+                return None
+            token = match.group(1)
+            args = match.group(2).split()
+        else:
+            if self._is_single:
+                if not content or content[0] != self._prefix_char:
+                    return None
+            elif not content.startswith(self.prefix):
+                return None
+            
+            if len(content) <= self._prefix_len:
+                return None
+            
+            # Tokenize the remainder directly; str.split() with no separator
+            # already drops leading/trailing whitespace, so no strip() is needed
+            parts = content[self._prefix_len:].split()
+            if not parts:
+                return None
+            token = parts[0]
+            args = parts[1:]
         
-        parts = split_command(content, self.prefix)
-        if not parts:
-            return None
+        # Commands are almost always typed in lowercase already; reuse the
+        # token as-is instead of allocating a lowered copy
+        command = token if token.isascii() and token.islower() else token.lower()
+        # Interned to match the interned registry keys in EventManager
+        command = sys.intern(command)
         
         return ParsedCommand(
-            command=parts[0].lower(),
-            args=parts[1:],
+            command=command,
+            args=args,
             content=content
         )
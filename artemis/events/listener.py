@@ -4,11 +4,12 @@ Copyright 2025, Vijay Challa - Use of this source code follows the MIT license f
 EventListener class for registering event handlers
 """
 
+import sys
 from typing import Callable, Optional, Any, Union
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class EventListener:
     """
     Represents an event listener configuration.
@@ -27,12 +28,13 @@ class EventListener:
     
     def add_event(self, event_name: str) -> "EventListener":
         """Add a Discord event to listen to."""
-        self.event_name = event_name
+        self.event_name = sys.intern(event_name)
         return self
     
     def add_command(self, command: str) -> "EventListener":
         """Add a command to listen to."""
-        self.command = command
+        # Interned so registry keys and parsed command names compare by identity
+        self.command = sys.intern(command)
         return self
     
     def set_periodic(self, interval: int) -> "EventListener":
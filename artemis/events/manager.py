@@ -5,13 +5,24 @@ EventManager for handling Discord events, commands, and periodic tasks
 """
 
 import asyncio
-from typing import Dict, List, Callable, Optional, Union
+import heapq
+import sys
+from typing import Awaitable, Dict, Callable, Optional, Sequence, Set, Tuple, Union
 import logging
 
 from artemis.events.listener import EventListener
 
 logger = logging.getLogger("artemis.events")
 
+# Task(eager_start=...) is only available from Python 3.12
+_EAGER_START = sys.version_info >= (3, 12)
+
+
+def _resolve(future: asyncio.Future) -> None:
+    """Resolve a wakeup future unless it is already done."""
+    if not future.done():
+        future.set_result(None)
+
 
 class EventManager:
     """Manages event listeners, commands, and periodic tasks."""
@@ -24,11 +35,18 @@ class EventManager:
             bot: Bot instance
         """
         self.bot = bot
-        self.event_listeners: Dict[str, List[Callable]] = {}
-        self.command_listeners: Dict[str, List[tuple]] = {}  # List of (callback, guild_id, help_text) tuples
-        self.command_help: Dict[str, Union[str, Callable]] = {}  # Command name -> help text/callable
-        self.periodic_tasks: List[tuple] = []  # List of (interval, callback) tuples
-        self._periodic_task_handles: List[asyncio.Task] = []
+        # Registries are lists while plugins register and tuples after freeze()
+        self.event_listeners: Dict[str, Sequence[Tuple[Callable, bool]]] = {}  # (callback, is_coro) tuples
+        # Command name -> guild ID filter (None for all guilds) -> (callback, is_coro) tuples
+        self.command_listeners: Dict[str, Dict[Optional[int], Sequence[Tuple[Callable, bool]]]] = {}
+        self.command_help: Dict[str, str] = {}  # Command name -> static help text
+        self._help_producers: Dict[str, Callable[[], Awaitable[str]]] = {}  # Command name -> async help text producer
+        self.periodic_tasks: Sequence[tuple] = []  # Sequence of (interval, callback, is_coro) tuples
+        self._periodic_task_handles: Set[asyncio.Task] = set()  # Scheduler plus in-flight async periodic runs
+        self._scheduler: Optional["_PeriodicScheduler"] = None  # Running periodic task scheduler
+        # Command name -> callback, for commands with a single unfiltered async listener
+        self._command_fastpath: Dict[str, Callable] = {}
+        self._frozen = False
     
     def add_listener(self, listener: EventListener) -> None:
         """
@@ -37,28 +55,102 @@ class EventManager:
         Args:
             listener: EventListener configuration
         """
+        frozen = self._frozen
+        if frozen:
+            self._thaw()
+        
+        # Resolved once here so dispatch doesn't re-inspect the callback each call
+        is_coro = asyncio.iscoroutinefunction(listener.callback)
+        
         if listener.event_name:
-            if listener.event_name not in self.event_listeners:
-                self.event_listeners[listener.event_name] = []
+            listeners = self.event_listeners.setdefault(listener.event_name, [])
             if listener.callback:
-                self.event_listeners[listener.event_name].append(listener.callback)
-                logger.debug(f"Registered event listener: {listener.event_name}")
+                listeners.append((listener.callback, is_coro))
+                logger.debug("Registered event listener: %s", listener.event_name)
         
         if listener.command:
-            if listener.command not in self.command_listeners:
-                self.command_listeners[listener.command] = []
+            buckets = self.command_listeners.setdefault(listener.command, {})
             if listener.callback:
-                # Store callback with guild_id filter (None if no filter) and help text
-                self.command_listeners[listener.command].append((listener.callback, listener.guild_id, listener.help_text))
+                # Bucket callbacks by guild_id filter (None if no filter) so
+                # dispatch only looks at the global and current-guild buckets
+                buckets.setdefault(listener.guild_id, []).append((listener.callback, is_coro))
                 # Store help text if provided (overwrites previous if multiple listeners for same command)
                 if listener.help_text:
-                    self.command_help[listener.command] = listener.help_text
+                    self._set_help(listener.command, listener.help_text)
+                
+                if list(buckets) == [None] and len(buckets[None]) == 1 and is_coro:
+                    self._command_fastpath[listener.command] = listener.callback
+                else:
+                    self._command_fastpath.pop(listener.command, None)
                 logger.info(f"Registered command listener: {listener.command}" + 
                            (f" (guild: {listener.guild_id})" if listener.guild_id else ""))
         
         if listener.periodic and listener.callback:
-            self.periodic_tasks.append((listener.periodic, listener.callback))
-            logger.debug(f"Registered periodic task: {listener.periodic}s interval")
+            self.periodic_tasks.append((listener.periodic, listener.callback, is_coro))
+            logger.debug("Registered periodic task: %ss interval", listener.periodic)
+        
+        if frozen:
+            self.freeze()
+    
+    def _set_help(self, command: str, help_source: Union[str, Callable]) -> None:
+        """
+        Store help for a command, normalizing callables to async producers.
+        
+        Args:
+            command: Command name
+            help_source: Help text or callable (sync or async) returning help text
+        """
+        if isinstance(help_source, str):
+            self.command_help[command] = help_source
+            self._help_producers.pop(command, None)
+            return
+        
+        if asyncio.iscoroutinefunction(help_source):
+            producer = help_source
+        else:
+            async def producer():
+                return help_source()
+        
+        self._help_producers[command] = producer
+        self.command_help.pop(command, None)
+    
+    def freeze(self) -> None:
+        """
+        Convert listener registries to tuples once registration is complete.
+        
+        Tuples are smaller and iterate faster than lists on the dispatch path.
+        Listeners added afterwards are still accepted (the registries are
+        thawed and re-frozen around the addition).
+        """
+        self.event_listeners = {k: tuple(v) for k, v in self.event_listeners.items()}
+        self.command_listeners = {
+            k: {guild_id: tuple(v) for guild_id, v in buckets.items()}
+            for k, buckets in self.command_listeners.items()
+        }
+        self.periodic_tasks = tuple(self.periodic_tasks)
+        self._frozen = True
+    
+    def _thaw(self) -> None:
+        """Convert frozen listener registries back to mutable lists."""
+        self.event_listeners = {k: list(v) for k, v in self.event_listeners.items()}
+        self.command_listeners = {
+            k: {guild_id: list(v) for guild_id, v in buckets.items()}
+            for k, buckets in self.command_listeners.items()
+        }
+        self.periodic_tasks = list(self.periodic_tasks)
+        self._frozen = False
+    
+    def has_listeners(self, event_name: str) -> bool:
+        """
+        Check whether any callbacks are registered for an event.
+        
+        Args:
+            event_name: Name of the event
+            
+        Returns:
+            True if at least one listener is registered, False otherwise
+        """
+        return bool(self.event_listeners.get(event_name))
     
     async def dispatch_event(self, event_name: str, *args, **kwargs) -> None:
         """
@@ -69,15 +161,17 @@ class EventManager:
             *args: Event arguments
             **kwargs: Event keyword arguments
         """
-        if event_name in self.event_listeners:
-            for callback in self.event_listeners[event_name]:
-                try:
-                    if asyncio.iscoroutinefunction(callback):
-                        await callback(*args, **kwargs)
-                    else:
-                        callback(*args, **kwargs)
-                except Exception as e:
-                    logger.error(f"Error in event listener for {event_name}: {e}", exc_info=True)
+        listeners = self.event_listeners.get(event_name)
+        if not listeners:
+            return
+        
+        coros = []
+        for callback, is_coro in listeners:
+            result = self._call_listener(callback, args, kwargs, "event", event_name)
+            if is_coro and result is not None:
+                coros.append(result)
+        
+        await self._gather_callbacks(coros, "event", event_name)
     
     async def dispatch_command(self, command: str, parsed_args: Optional[list] = None, *args, **kwargs) -> None:
         """
@@ -89,35 +183,90 @@ class EventManager:
             *args: Command arguments (EventData)
             **kwargs: Command keyword arguments
         """
-        logger.info(f"Dispatching command: '{command}', available commands: {sorted(self.command_listeners.keys())}")
+        logger.info("Dispatching command: '%s'", command)
         
         if parsed_args and "-help" in parsed_args:
             await self._handle_help(command, args[0] if args else None)
             return
         
-        if command in self.command_listeners:
+        # Common case: one async listener with no guild filter
+        callback = self._command_fastpath.get(command)
+        if callback is not None:
+            try:
+                await callback(*args, **kwargs)
+            except Exception as e:
+                logger.error("Error in command listener for %s: %s", command, e, exc_info=True)
+            return
+        
+        buckets = self.command_listeners.get(command)
+        if buckets:
             # Extract guild from EventData if present
-            guild_id = None
-            if args and hasattr(args[0], 'guild') and args[0].guild:
-                guild_id = args[0].guild.id
+            guild = getattr(args[0], 'guild', None) if args else None
+            guild_id = guild.id if guild else None
             
-            for callback_tuple in self.command_listeners[command]:
-                callback = callback_tuple[0]
-                filter_guild_id = callback_tuple[1] if len(callback_tuple) > 1 else None
-                
-                if filter_guild_id is not None and guild_id != filter_guild_id:
-                    logger.debug(f"Skipping command {command} due to guild filter: {filter_guild_id} != {guild_id}")
-                    continue
-                
-                try:
-                    if asyncio.iscoroutinefunction(callback):
-                        await callback(*args, **kwargs)
-                    else:
-                        callback(*args, **kwargs)
-                except Exception as e:
-                    logger.error(f"Error in command listener for {command}: {e}", exc_info=True)
-        else:
-            logger.warning(f"Command '{command}' not found in registered commands: {sorted(self.command_listeners.keys())}")
+            # Listeners for all guilds, then those filtered to this guild
+            global_handlers = buckets.get(None, ())
+            guild_handlers = buckets.get(guild_id, ()) if guild_id is not None else ()
+            
+            coros = []
+            for handlers in (global_handlers, guild_handlers):
+                for callback, is_coro in handlers:
+                    result = self._call_listener(callback, args, kwargs, "command", command)
+                    if is_coro and result is not None:
+                        coros.append(result)
+            
+            await self._gather_callbacks(coros, "command", command)
+        elif logger.isEnabledFor(logging.WARNING):
+            # Only sort the registered names when the warning will actually be emitted
+            logger.warning("Command '%s' not found in registered commands: %s", command, sorted(self.command_listeners))
+    
+    def _call_listener(self, callback: Callable, args: tuple, kwargs: dict, kind: str, name: str):
+        """
+        Call a listener callback, logging any exception it raises.
+        
+        For async callbacks this only creates the coroutine, but that can still
+        raise (e.g. a TypeError for a mismatched signature), so it is isolated
+        the same way as a synchronous call.
+        
+        Args:
+            callback: Listener callback
+            args: Positional arguments for the callback
+            kwargs: Keyword arguments for the callback
+            kind: Listener kind for error messages ("event" or "command")
+            name: Event or command name
+            
+        Returns:
+            The callback's return value (the coroutine for async callbacks), or None if it raised
+        """
+        try:
+            return callback(*args, **kwargs)
+        except Exception as e:
+            logger.error("Error in %s listener for %s: %s", kind, name, e, exc_info=True)
+            return None
+    
+    async def _gather_callbacks(self, coros: list, kind: str, name: str) -> None:
+        """
+        Run listener coroutines concurrently and log any that failed.
+        
+        On Python 3.12+ each listener task is started eagerly, so a listener
+        that never blocks finishes without a trip through the event loop.
+        Only these tasks are eager; the loop's task factory is left alone.
+        
+        Args:
+            coros: Coroutines returned by async listener callbacks
+            kind: Listener kind for error messages ("event" or "command")
+            name: Event or command name
+        """
+        if not coros:
+            return
+        
+        if _EAGER_START:
+            loop = asyncio.get_running_loop()
+            coros = [asyncio.Task(coro, loop=loop, eager_start=True) for coro in coros]
+        results = await asyncio.gather(*coros, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Error in %s listener for %s: %s", kind, name, result, exc_info=result)
     
     async def _handle_help(self, command: str, event_data) -> None:
         """
@@ -130,20 +279,14 @@ class EventManager:
         if not event_data or not hasattr(event_data, 'message'):
             return
         
-        help_text = None
-        
-        if command in self.command_help:
-            help_source = self.command_help[command]
-            if isinstance(help_source, str):
-                help_text = help_source
-            elif callable(help_source):
+        help_text = self.command_help.get(command)
+        if help_text is None:
+            producer = self._help_producers.get(command)
+            if producer is not None:
                 try:
-                    if asyncio.iscoroutinefunction(help_source):
-                        help_text = await help_source()
-                    else:
-                        help_text = help_source()
+                    help_text = await producer()
                 except Exception as e:
-                    logger.error(f"Error calling help function for {command}: {e}")
+                    logger.error("Error calling help function for %s: %s", command, e)
         
         # Send help message
         if help_text:
@@ -152,28 +295,117 @@ class EventManager:
             await event_data.message.reply(f"No help available for command `{command}`.")
     
     def start_periodic_tasks(self) -> None:
-        """Start all registered periodic tasks."""
-        for interval, callback in self.periodic_tasks:
-            task = asyncio.create_task(self._run_periodic(interval, callback))
-            self._periodic_task_handles.append(task)
+        """Start all registered periodic tasks (no-op if they are already running)."""
+        if not self.periodic_tasks:
+            return
+        
+        # on_ready fires again on every gateway reconnect
+        scheduler = self._scheduler
+        if scheduler is not None and not scheduler.task.done():
+            logger.debug("Periodic tasks already running, not starting another scheduler")
+            return
+        
+        # One scheduler task drives every periodic callback from a heap of
+        # (next deadline, tie-breaker, interval, callback, is_coro) entries
+        now = asyncio.get_running_loop().time()
+        heap = []
+        for index, (interval, callback, is_coro) in enumerate(self.periodic_tasks):
+            heap.append((now + interval, index, interval, callback, is_coro))
             logger.info(f"Started periodic task: {interval}s interval")
-    
-    async def _run_periodic(self, interval: int, callback: Callable) -> None:
-        """Run a periodic task."""
-        while True:
-            try:
-                await asyncio.sleep(interval)
-                if asyncio.iscoroutinefunction(callback):
-                    await callback(self.bot)
-                else:
-                    callback(self.bot)
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Error in periodic task: {e}", exc_info=True)
+        heapq.heapify(heap)
+        
+        self._scheduler = _PeriodicScheduler(self.bot, heap, self._periodic_task_handles)
+        self._periodic_task_handles.add(self._scheduler.task)
     
     def stop_periodic_tasks(self) -> None:
         """Stop all periodic tasks."""
-        for task in self._periodic_task_handles:
+        for task in list(self._periodic_task_handles):
             task.cancel()
         self._periodic_task_handles.clear()
+        self._scheduler = None
+
+
+class _PeriodicScheduler:
+    """
+    Single task that runs periodic callbacks as their deadlines come due.
+    
+    A callback's heap entry leaves the heap while it runs and is pushed back
+    onto this scheduler's heap once the run finishes, so runs of the same
+    callback never overlap and a stalled callback doesn't get a burst of
+    catch-up runs.
+    """
+    
+    def __init__(self, bot, heap: list, task_handles: Set[asyncio.Task]):
+        """
+        Start the scheduler task.
+        
+        Args:
+            bot: Bot instance passed to the callbacks
+            heap: Heap of (next deadline, tie-breaker, interval, callback, is_coro) entries
+            task_handles: Set that in-flight async runs are added to, so they can be cancelled
+        """
+        self.bot = bot
+        self.heap = heap
+        self.task_handles = task_handles
+        self.wakeup: Optional[asyncio.Future] = None  # Resolved to wake the sleeping scheduler
+        self.task = asyncio.create_task(self._run())
+    
+    async def _run(self) -> None:
+        """Scheduler loop: sleep until the next deadline, then start that callback."""
+        loop = asyncio.get_running_loop()
+        heap = self.heap
+        bot = self.bot
+        
+        while True:
+            delay = heap[0][0] - loop.time() if heap else None
+            if delay is None or delay > 0:
+                # Sleep until the next deadline, or until a finished run requeues its callback
+                wakeup = self.wakeup = loop.create_future()
+                timer = loop.call_later(delay, _resolve, wakeup) if delay is not None else None
+                try:
+                    await wakeup
+                except asyncio.CancelledError:
+                    break
+                finally:
+                    if timer is not None:
+                        timer.cancel()
+                    self.wakeup = None
+                continue
+            
+            entry = heapq.heappop(heap)
+            callback, is_coro = entry[3], entry[4]
+            if is_coro:
+                # Run as its own task so a slow callback doesn't delay the others
+                task = asyncio.create_task(self._run_callback(entry, callback))
+                self.task_handles.add(task)
+                task.add_done_callback(self.task_handles.discard)
+            else:
+                try:
+                    callback(bot)
+                except Exception as e:
+                    logger.error("Error in periodic task: %s", e, exc_info=True)
+                self._requeue(entry)
+    
+    async def _run_callback(self, entry: tuple, callback: Callable) -> None:
+        """Await a single run of an async periodic callback, logging failures, then requeue it."""
+        try:
+            await callback(self.bot)
+        except Exception as e:
+            logger.error("Error in periodic task: %s", e, exc_info=True)
+        self._requeue(entry)
+    
+    def _requeue(self, entry: tuple) -> None:
+        """
+        Schedule a periodic callback's next run one interval after its last run finished.
+        
+        Args:
+            entry: The callback's heap entry from its last run
+        """
+        if self.task.done():
+            return  # Stopped; don't feed a heap nobody is reading
+        
+        _, index, interval, callback, is_coro = entry
+        deadline = asyncio.get_running_loop().time() + interval
+        heapq.heappush(self.heap, (deadline, index, interval, callback, is_coro))
+        if self.wakeup is not None:
+            _resolve(self.wakeup)
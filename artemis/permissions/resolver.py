@@ -42,8 +42,7 @@ class Permission:
             True if permission granted, False otherwise
         """
         if self.message and self.message.author:
-            admin_ids = getattr(self.bot.config, 'ADMIN_USER_IDS', [])
-            if str(self.message.author.id) in admin_ids:
+            if self.message.author.id in self.bot.admin_ids:
                 return True
         
         return self.default
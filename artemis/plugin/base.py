@@ -5,20 +5,39 @@ Plugin base classes and helpers
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, TYPE_CHECKING
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 import logging
 import re
 import disnake
 from dateutil import parser as date_parser
 from dateutil.relativedelta import relativedelta
 from datetime import datetime
-import pytz
+from zoneinfo import ZoneInfo
 
 if TYPE_CHECKING:
     from artemis.bot import ArtemisBot
 
 logger = logging.getLogger("artemis.plugin")
 
+_MENTION_RE = re.compile(r'<@!?(\d+)>')
+_ROLE_RE = re.compile(r'<@&(\d+)>')
+_CHANNEL_RE = re.compile(r'<#(\d+)>')
+_MSG_URL_RE = re.compile(r'/(\d+)/(\d+)/(\d+)')
+_REL_TIME_PATTERNS = [
+    (re.compile(r'(\d+)\s*h(?:ours?)?'), lambda m: relativedelta(hours=int(m.group(1)))),
+    (re.compile(r'(\d+)\s*m(?:inutes?)?'), lambda m: relativedelta(minutes=int(m.group(1)))),
+    (re.compile(r'(\d+)\s*d(?:ays?)?'), lambda m: relativedelta(days=int(m.group(1)))),
+    (re.compile(r'(\d+)\s*w(?:eeks?)?'), lambda m: relativedelta(weeks=int(m.group(1)))),
+]
+
+
+@lru_cache(maxsize=64)
+def _tz(name: str) -> ZoneInfo:
+    """Get a (cached) tzinfo for an IANA timezone name."""
+    return ZoneInfo(name)
+
 
 class PluginInterface(ABC):
     """
@@ -26,6 +45,14 @@ class PluginInterface(ABC):
     Plugins must implement the register method.
     """
     
+    # Every subclass, in definition order; read by PluginLoader instead of
+    # introspecting plugin modules
+    _registry: List[type] = []
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        PluginInterface._registry.append(cls)
+    
     @staticmethod
     @abstractmethod
     def register(bot: "ArtemisBot") -> None:
@@ -44,13 +71,56 @@ class PluginHelper:
     Mixin class providing common utilities for plugins.
     """
     
+    # Guild ID -> (name#discriminator -> member, lowercase name/display name -> member,
+    #              sorted lowercase names, members in the same order as those names)
+    _member_index: Dict[int, Tuple[Dict[str, disnake.Member], Dict[str, disnake.Member], List[str], List[disnake.Member]]] = {}
+    
+    @staticmethod
+    def invalidate_member_index(guild_id: Optional[int] = None) -> None:
+        """
+        Drop the cached member name index used by parse_guild_user.
+        
+        Args:
+            guild_id: Guild whose index to drop (all guilds if None)
+        """
+        if guild_id is None:
+            PluginHelper._member_index.clear()
+        else:
+            PluginHelper._member_index.pop(guild_id, None)
+    
+    @staticmethod
+    def _get_member_index(guild: disnake.Guild):
+        """Get (building on first use) the member name index for a guild."""
+        index = PluginHelper._member_index.get(guild.id)
+        if index is None:
+            tags = {}
+            exact = {}
+            names = []
+            for member in guild.members:
+                tags.setdefault(f"{member.name}#{member.discriminator}", member)
+                # Each name is lowercased once here rather than on every lookup
+                name = member.name
+                name_lower = name.lower()
+                exact.setdefault(name_lower, member)
+                names.append((name_lower, member))
+                display_name = member.display_name
+                if display_name and display_name != name:
+                    display_lower = display_name.lower()
+                    if display_lower != name_lower:
+                        exact.setdefault(display_lower, member)
+                        names.append((display_lower, member))
+            names.sort(key=lambda pair: pair[0])
+            index = (tags, exact, [name for name, _ in names], [member for _, member in names])
+            PluginHelper._member_index[guild.id] = index
+        return index
+    
     @staticmethod
     def is_testing_client(bot: "ArtemisBot") -> bool:
         """Check if bot is in testing mode."""
         return getattr(bot.config, 'TESTING_MODE', False)
     
     @staticmethod
-    def split_command(content: str, prefix: str = "!") -> list:
+    def split_command(content: str, prefix: Optional[str] = None) -> list:
         """Split command content into parts."""
         from artemis.utils.helpers import split_command
         return split_command(content, prefix)
@@ -102,7 +172,7 @@ class PluginHelper:
         
         text = text.strip()
         
-        mention_match = re.match(r'<@!?(\d+)>', text)
+        mention_match = _MENTION_RE.match(text)
         if mention_match:
             user_id = int(mention_match.group(1))
             member = guild.get_member(user_id)
@@ -125,24 +195,23 @@ class PluginHelper:
         except ValueError:
             pass
         
+        tags, exact, names, members = PluginHelper._get_member_index(guild)
+        
         if '#' in text:
-            username, discriminator = text.rsplit('#', 1)
-            for member in guild.members:
-                if member.name == username and member.discriminator == discriminator:
-                    return member
+            member = tags.get(text)
+            if member:
+                return member
         
         text_lower = text.lower()
-        matches = []
-        for member in guild.members:
-            if (member.name.lower() == text_lower or 
-                (member.display_name and member.display_name.lower() == text_lower)):
-                return member
-            if (member.name.lower().startswith(text_lower) or 
-                (member.display_name and member.display_name.lower().startswith(text_lower))):
-                matches.append(member)
+        member = exact.get(text_lower)
+        if member:
+            return member
         
-        if matches:
-            return matches[0]
+        # Names are sorted, so the first name with this prefix (if any) is at
+        # the bisection point
+        i = bisect_left(names, text_lower)
+        if i < len(names) and names[i].startswith(text_lower):
+            return members[i]
         
         return None
     
@@ -163,7 +232,7 @@ class PluginHelper:
         
         text = text.strip()
         
-        mention_match = re.match(r'<@&(\d+)>', text)
+        mention_match = _ROLE_RE.match(text)
         if mention_match:
             role_id = int(mention_match.group(1))
             return guild.get_role(role_id)
@@ -193,7 +262,7 @@ class PluginHelper:
         Returns:
             TextChannel if found, None otherwise
         """
-        match = re.match(r'<#(\d+)>', text)
+        match = _CHANNEL_RE.match(text)
         if match:
             channel_id = int(match.group(1))
             channel = guild.get_channel(channel_id)
@@ -214,32 +283,35 @@ class PluginHelper:
             datetime object
         """
         time_str = time_str.strip()
-        tz = pytz.timezone(timezone)
-        now = datetime.now(tz)
-        
-        relative_patterns = [
-            (r'(\d+)\s*h(?:ours?)?', lambda m: relativedelta(hours=int(m.group(1)))),
-            (r'(\d+)\s*m(?:inutes?)?', lambda m: relativedelta(minutes=int(m.group(1)))),
-            (r'(\d+)\s*d(?:ays?)?', lambda m: relativedelta(days=int(m.group(1)))),
-            (r'(\d+)\s*w(?:eeks?)?', lambda m: relativedelta(weeks=int(m.group(1)))),
-        ]
+        tz = _tz(timezone)
         
         delta = relativedelta()
         remaining = time_str.lower()
-        for pattern, func in relative_patterns:
-            match = re.search(pattern, remaining)
+        for pattern, func in _REL_TIME_PATTERNS:
+            match = pattern.search(remaining)
             if match:
                 delta += func(match)
                 remaining = remaining.replace(match.group(0), '').strip()
         
         if delta != relativedelta():
-            result = now + delta
+            result = datetime.now(tz) + delta
             return result
         
+        # ISO-8601 date-times (anything longer than a bare date, whose missing
+        # time dateutil fills from "now") parse far faster with fromisoformat
+        if len(time_str) > 10:
+            try:
+                parsed = datetime.fromisoformat(time_str)
+                if parsed.tzinfo is None:
+                    parsed = parsed.replace(tzinfo=tz)
+                return parsed
+            except ValueError:
+                pass
+        
         try:
-            parsed = date_parser.parse(time_str, default=now)
+            parsed = date_parser.parse(time_str, default=datetime.now(tz))
             if parsed.tzinfo is None:
-                parsed = tz.localize(parsed)
+                parsed = parsed.replace(tzinfo=tz)
             return parsed
         except:
             raise ValueError(f"Could not parse time: {time_str}")
@@ -256,7 +328,7 @@ class PluginHelper:
         Returns:
             Message if found, None otherwise
         """
-        message_id_match = re.search(r'/(\d+)/(\d+)/(\d+)', text)
+        message_id_match = _MSG_URL_RE.search(text)
         if message_id_match:
             guild_id = int(message_id_match.group(1))
             channel_id = int(message_id_match.group(2))
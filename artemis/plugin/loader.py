@@ -5,9 +5,11 @@ Plugin loader for auto-discovering and loading plugins
 """
 
 import importlib
-import inspect
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Type
+from types import ModuleType
+from typing import Dict, List, Optional, Tuple, Type
 import logging
 
 from artemis.plugin.base import PluginInterface
@@ -30,6 +32,33 @@ class PluginLoader:
         self.loaded_plugins: List[Type[PluginInterface]] = []
         logger.info(f"Plugin loader initialized with plugins directory: {self.plugins_dir}")
     
+    @staticmethod
+    def _import_module(module_name: str) -> Tuple[Optional[ModuleType], Optional[Exception]]:
+        """
+        Import a plugin module, capturing any error for the caller to report.
+        
+        Returns:
+            (module, None) on success, (None, exception) on failure
+        """
+        try:
+            return importlib.import_module(module_name), None
+        except Exception as e:
+            return None, e
+    
+    @staticmethod
+    def _group_registry() -> Dict[str, List[Type[PluginInterface]]]:
+        """
+        Group registered plugin classes by the plugin package that defines them.
+        
+        Returns:
+            Mapping of package name (e.g. "plugins.remind") -> plugin classes
+        """
+        groups: Dict[str, List[Type[PluginInterface]]] = {}
+        for obj in PluginInterface._registry:
+            package = ".".join(obj.__module__.split(".", 2)[:2])
+            groups.setdefault(package, []).append(obj)
+        return groups
+    
     def discover_plugins(self) -> List[Type[PluginInterface]]:
         """
         Discover all plugins in the plugins directory.
@@ -38,6 +67,7 @@ class PluginLoader:
             List of plugin classes
         """
         plugins = []
+        seen = set()
         
         if not self.plugins_dir.exists():
             logger.error(f"Plugins directory {self.plugins_dir} does not exist! Current working directory: {Path.cwd()}")
@@ -45,28 +75,46 @@ class PluginLoader:
         
         logger.info(f"Discovering plugins in: {self.plugins_dir}")
         
-        for plugin_dir in self.plugins_dir.iterdir():
-            if not plugin_dir.is_dir():
-                continue
-            
-            logger.debug(f"Checking plugin directory: {plugin_dir.name}")
+        # scandir() hands back the entry type from the directory listing, so
+        # only real package candidates cost a further stat (for __init__.py)
+        plugin_names = []
+        with os.scandir(self.plugins_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith(('_', '.')) or not entry.is_dir():
+                    continue
+                if os.path.isfile(os.path.join(entry.path, "__init__.py")):
+                    plugin_names.append(name)
+        plugin_names.sort()
+        
+        # Import the plugin packages concurrently so their file reads and
+        # bytecode loads overlap; class discovery below stays sequential
+        module_names = [f"plugins.{plugin_name}" for plugin_name in plugin_names]
+        import_results = []
+        if module_names:
+            with ThreadPoolExecutor(max_workers=min(8, len(module_names))) as executor:
+                import_results = list(executor.map(self._import_module, module_names))
+        
+        # PluginInterface records subclasses as they are defined, so once the
+        # packages are imported the registry already holds every plugin class
+        registry_by_package = self._group_registry()
+        
+        for plugin_name, module_name, (module, import_error) in zip(plugin_names, module_names, import_results):
+            logger.debug("Checking plugin directory: %s", plugin_name)
             
-            module_name = f"plugins.{plugin_dir.name}"
+            plugin_dir = self.plugins_dir / plugin_name
             
             try:
-                module = importlib.import_module(module_name)
-                logger.debug(f"Imported module: {module_name}")
-                
-                for name, obj in inspect.getmembers(module, inspect.isclass):
-                    if (issubclass(obj, PluginInterface) and 
-                        obj != PluginInterface):
-                        obj_module = obj.__module__
-                        if (obj_module == module.__name__ or 
-                            obj_module.startswith(f"{module.__name__}.")):
-                            if obj not in plugins:
-                                plugins.append(obj)
-                                logger.info(f"Discovered plugin: {name} from {obj_module} (via {module_name})")
+                if import_error is not None:
+                    raise import_error
+                logger.debug("Imported module: %s", module_name)
                 
+                # Pick out the classes defined inside this package and exposed on it
+                for obj in registry_by_package.get(module.__name__, ()):
+                    if getattr(module, obj.__name__, None) is obj and obj not in seen:
+                        seen.add(obj)
+                        plugins.append(obj)
+                        logger.info(f"Discovered plugin: {obj.__name__} from {obj.__module__} (via {module_name})")
             
             except ImportError as e:
                 logger.error(f"Failed to import plugin module {module_name}: {e}")
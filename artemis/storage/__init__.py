@@ -4,7 +4,13 @@ Copyright 2025, Vijay Challa - Use of this source code follows the MIT license f
 Storage module for Artemis bot.
 """
 
-from artemis.storage.json_store import JSONStore
-
 __all__ = ['JSONStore']
 
+
+def __getattr__(name):
+    # JSONStore (and with it aiofiles) is only imported on first access
+    if name == "JSONStore":
+        from artemis.storage.json_store import JSONStore
+        return JSONStore
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
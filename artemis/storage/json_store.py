@@ -7,15 +7,19 @@ This module provides a simple key-value storage system using JSON files.
 Data is organized by namespace, with each namespace stored in its own JSON file.
 """
 
-import json
+import asyncio
 import logging
 from pathlib import Path
-from typing import Any, Dict, Optional
-import aiofiles
-import aiofiles.os
+from typing import Any, Dict, Optional, Set
+import orjson
 
 logger = logging.getLogger("artemis.storage")
 
+# Seconds to wait after a write before flushing the namespace to disk, so bursts coalesce
+_FLUSH_DELAY = 0.25
+# Seconds to wait before retrying a flush that failed
+_RETRY_DELAY = 5.0
+
 
 class JSONStore:
     """
@@ -23,8 +27,31 @@ class JSONStore:
     
     Data is organized by namespace, with each namespace stored in a separate JSON file.
     Files are stored in the storage directory, one file per namespace.
+    
+    Each namespace is read from disk once and then kept in memory. Writes update
+    the in-memory copy and mark the namespace dirty; dirty namespaces are written
+    to disk shortly afterwards, so a burst of writes results in a single file write.
+    
+    Values are held as their encoded JSON, so every read returns a fresh object
+    that looks exactly as it would after a restart, and callers can't change
+    stored data without going through set(). Keys are always strings.
     """
     
+    _aiofiles = None  # aiofiles module, imported on first file access
+    
+    @classmethod
+    def _io(cls):
+        """
+        Get the aiofiles module, importing it on first use.
+        
+        The import is deferred so startup doesn't pay for it until storage is touched.
+        """
+        if cls._aiofiles is None:
+            import aiofiles
+            import aiofiles.os
+            cls._aiofiles = aiofiles
+        return cls._aiofiles
+    
     def __init__(self, storage_dir: str = "storage"):
         """
         Initialize the JSON storage system.
@@ -34,6 +61,11 @@ class JSONStore:
         """
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self._cache: Dict[str, Dict[str, bytes]] = {}  # Namespace -> key -> encoded value
+        self._locks: Dict[str, asyncio.Lock] = {}  # Namespace -> lock guarding load/write
+        self._dirty: Set[str] = set()  # Namespaces with changes not yet on disk
+        self._flush_handles: Dict[str, asyncio.TimerHandle] = {}  # Pending delayed flushes
+        self._flush_tasks: Set[asyncio.Task] = set()  # Flushes currently running
         logger.info(f"Initialized JSONStore with storage directory: {self.storage_dir}")
     
     def _get_namespace_path(self, namespace: str) -> Path:
@@ -50,38 +82,135 @@ class JSONStore:
         safe_namespace = namespace.replace('/', '_').replace('\\', '_')
         return self.storage_dir / f"{safe_namespace}.json"
     
-    async def get(self, namespace: str, key: str) -> Optional[Any]:
+    def _get_lock(self, namespace: str) -> asyncio.Lock:
+        """Get the lock for a namespace, creating it on first use."""
+        lock = self._locks.get(namespace)
+        if lock is None:
+            lock = self._locks[namespace] = asyncio.Lock()
+        return lock
+    
+    async def _load_namespace(self, namespace: str) -> Dict[str, bytes]:
         """
-        Get a value from storage.
+        Get the in-memory contents of a namespace, reading its file on first use.
         
         Args:
-            namespace: The namespace to read from
-            key: The key to retrieve
+            namespace: The namespace to load
             
         Returns:
-            The stored value, or None if not found
+            The cached key -> encoded value mapping for this namespace (empty if the
+            file is missing or does not contain a JSON object)
         """
-        try:
-            file_path = self._get_namespace_path(namespace)
+        data = self._cache.get(namespace)
+        if data is not None:
+            return data
+        
+        async with self._get_lock(namespace):
+            # Another caller may have loaded it while we waited
+            data = self._cache.get(namespace)
+            if data is not None:
+                return data
             
-            if not await aiofiles.os.path.exists(file_path):
-                return None
+            file_path = self._get_namespace_path(namespace)
+            data = {}
+            aio = self._io()
+            try:
+                async with aio.open(file_path, 'rb') as f:
+                    content = await f.read()
+            except FileNotFoundError:
+                content = b""
             
-            async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
-                content = await f.read()
-                if not content.strip():
-                    return None
-                
-                data = json.loads(content)
+            if content.strip():
+                try:
+                    data = orjson.loads(content)
+                except orjson.JSONDecodeError as e:
+                    logger.error(f"Error decoding JSON from {file_path}: {e}")
+                    data = {}
                 if not isinstance(data, dict):
                     logger.warning(f"Storage file {file_path} contains invalid data (not a dict)")
-                    return None
-                
-                return data.get(key)
+                    data = {}
+                data = {key: orjson.dumps(value) for key, value in data.items()}
+            
+            self._cache[namespace] = data
+            return data
+    
+    async def _write_namespace(self, namespace: str, data: Dict[str, bytes]) -> None:
+        """
+        Atomically replace a namespace's file with its contents.
+        
+        Args:
+            namespace: The namespace to write
+            data: The namespace's keys mapped to their encoded values
+        """
+        file_path = self._get_namespace_path(namespace)
+        # Values are already encoded, so just splice them into one JSON object
+        content = b"{" + b",".join(orjson.dumps(key) + b":" + value for key, value in data.items()) + b"}"
+        
+        # Write to a sibling file and rename it over the original, so a crash
+        # mid-write can never leave a truncated namespace file behind
+        tmp_path = file_path.with_suffix('.json.tmp')
+        aio = self._io()
+        async with aio.open(tmp_path, 'wb') as f:
+            await f.write(content)
+        await aio.os.replace(tmp_path, file_path)
+    
+    def _mark_dirty(self, namespace: str, delay: float = _FLUSH_DELAY) -> None:
+        """
+        Mark a namespace as changed and schedule a delayed flush if none is pending.
+        
+        Args:
+            namespace: The namespace that was modified
+            delay: Seconds to wait before flushing
+        """
+        self._dirty.add(namespace)
+        if namespace not in self._flush_handles:
+            loop = asyncio.get_running_loop()
+            self._flush_handles[namespace] = loop.call_later(
+                delay, self._start_flush, namespace
+            )
+    
+    def _start_flush(self, namespace: str) -> None:
+        """Timer callback: run the flush for a namespace as a task."""
+        self._flush_handles.pop(namespace, None)
+        task = asyncio.create_task(self._flush_namespace(namespace))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+    
+    async def _flush_namespace(self, namespace: str) -> None:
+        """
+        Write a namespace to disk if it has unflushed changes.
+        
+        Args:
+            namespace: The namespace to flush
+        """
+        async with self._get_lock(namespace):
+            if namespace not in self._dirty:
+                return
+            
+            # Clear before writing so changes made during the write schedule another flush
+            self._dirty.discard(namespace)
+            try:
+                await self._write_namespace(namespace, self._cache[namespace])
+            except Exception as e:
+                logger.error(f"Error flushing storage namespace '{namespace}': {e}")
+                # Keep the changes and try again later rather than waiting for the next write
+                self._mark_dirty(namespace, _RETRY_DELAY)
+    
+    async def get(self, namespace: str, key: str) -> Optional[Any]:
+        """
+        Get a value from storage.
+        
+        Args:
+            namespace: The namespace to read from
+            key: The key to retrieve (converted to a string)
+            
+        Returns:
+            A fresh copy of the stored value, or None if not found
+        """
+        try:
+            data = await self._load_namespace(namespace)
+            encoded = data.get(str(key))
+            return orjson.loads(encoded) if encoded is not None else None
         
-        except json.JSONDecodeError as e:
-            logger.error(f"Error decoding JSON from {file_path}: {e}")
-            return None
         except Exception as e:
             logger.error(f"Error reading from storage namespace '{namespace}': {e}")
             return None
@@ -92,37 +221,19 @@ class JSONStore:
         
         Args:
             namespace: The namespace to write to
-            key: The key to store
+            key: The key to store (converted to a string)
             value: The value to store (must be JSON-serializable)
             
         Returns:
             True if successful, False otherwise
         """
         try:
-            file_path = self._get_namespace_path(namespace)
-            
-            # Read existing data
-            data = {}
-            if await aiofiles.os.path.exists(file_path):
-                try:
-                    async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
-                        content = await f.read()
-                        if content.strip():
-                            data = json.loads(content)
-                            if not isinstance(data, dict):
-                                logger.warning(f"Storage file {file_path} contains invalid data, resetting")
-                                data = {}
-                except json.JSONDecodeError:
-                    logger.warning(f"Storage file {file_path} is corrupted, resetting")
-                    data = {}
-            
-            # Update data
-            data[key] = value
-            
-            # Write back to file
-            async with aiofiles.open(file_path, 'w', encoding='utf-8') as f:
-                await f.write(json.dumps(data, indent=2, ensure_ascii=False))
-            
+            # Serialize up front so a bad value fails here instead of breaking the
+            # delayed flush for the whole namespace
+            encoded = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+            data = await self._load_namespace(namespace)
+            data[str(key)] = encoded
+            self._mark_dirty(namespace)
             return True
         
         except Exception as e:
@@ -140,26 +251,9 @@ class JSONStore:
             Dictionary of all key-value pairs in the namespace, or empty dict if not found
         """
         try:
-            file_path = self._get_namespace_path(namespace)
-            
-            if not await aiofiles.os.path.exists(file_path):
-                return {}
-            
-            async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
-                content = await f.read()
-                if not content.strip():
-                    return {}
-                
-                data = json.loads(content)
-                if not isinstance(data, dict):
-                    logger.warning(f"Storage file {file_path} contains invalid data (not a dict)")
-                    return {}
-                
-                return data
+            data = await self._load_namespace(namespace)
+            return {key: orjson.loads(value) for key, value in data.items()}
         
-        except json.JSONDecodeError as e:
-            logger.error(f"Error decoding JSON from {file_path}: {e}")
-            return {}
         except Exception as e:
             logger.error(f"Error reading from storage namespace '{namespace}': {e}")
             return {}
@@ -170,44 +264,36 @@ class JSONStore:
         
         Args:
             namespace: The namespace to delete from
-            key: The key to delete
+            key: The key to delete (converted to a string)
             
         Returns:
             True if successful, False otherwise
         """
         try:
-            file_path = self._get_namespace_path(namespace)
-            
-            if not await aiofiles.os.path.exists(file_path):
-                return False
-            
-            # Read existing data
-            data = {}
-            try:
-                async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
-                    content = await f.read()
-                    if content.strip():
-                        data = json.loads(content)
-                        if not isinstance(data, dict):
-                            logger.warning(f"Storage file {file_path} contains invalid data, resetting")
-                            data = {}
-            except json.JSONDecodeError:
-                logger.warning(f"Storage file {file_path} is corrupted, resetting")
-                data = {}
+            data = await self._load_namespace(namespace)
+            key = str(key)
             
             # Delete key if it exists
-            if key in data:
-                del data[key]
-                
-                # Write back to file
-                async with aiofiles.open(file_path, 'w', encoding='utf-8') as f:
-                    await f.write(json.dumps(data, indent=2, ensure_ascii=False))
-                
-                return True
+            if key not in data:
+                return False
             
-            return False
+            del data[key]
+            self._mark_dirty(namespace)
+            return True
         
         except Exception as e:
             logger.error(f"Error deleting from storage namespace '{namespace}': {e}")
             return False
-
+    
+    async def flush(self) -> None:
+        """Write all pending changes to disk immediately (e.g. on shutdown)."""
+        for handle in self._flush_handles.values():
+            handle.cancel()
+        self._flush_handles.clear()
+        
+        for namespace in list(self._dirty):
+            await self._flush_namespace(namespace)
+        
+        # Let any flush that was already running finish
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
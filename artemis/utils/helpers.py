@@ -6,25 +6,79 @@ Helper utility functions
 
 import re
 import hashlib
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple, Union
 
 
-def split_command(content: str, prefix: str = "!") -> List[str]:
+# Emoji alphabet used by emoji_hash
+_EMOJIS = (
+    "🔴", "🟠", "🟡", "🟢", "🔵", "🟣", "🟤", "⚪", "🟥",
+    "🟧", "🟨", "🟩", "🟦", "🟪", "🟫", "⬜", "🔶", "🔷",
+    "🔸", "🔹", "🔺", "🔻", "💠", "🔘", "🔳", "🔲", "❤️",
+    "♾️", "💯", "💢", "💨", "🔢", "0️⃣", "1️⃣", "2️⃣", "3️⃣",
+    "4️⃣", "5️⃣", "6️⃣", "7️⃣", "8️⃣", "9️⃣", "⭐", "✨", "💫",
+    "🔥", "💧", "🌊", "☀️", "🌙", "💀", "💎", "🎯", "🎲"
+)
+_EMOJI_COUNT = len(_EMOJIS)
+
+# Units used by format_bytes
+_BYTE_UNITS = ("bytes", "KiB", "MiB", "GiB", "TiB", "PiB", "EiB", "ZiB", "YiB")
+
+# Command prefixes recognized by split_command/arg_substr, longest first so "!!"
+# wins over "!"; replaced with the configured prefixes by set_command_prefixes
+_command_prefixes: Tuple[str, ...] = ("!",)
+
+
+def set_command_prefixes(prefix: Union[str, Sequence[str]]) -> None:
+    """
+    Set the command prefixes that split_command and arg_substr strip.
+    
+    Args:
+        prefix: Command prefix, or a sequence of accepted prefixes
+    """
+    global _command_prefixes
+    prefixes = (prefix,) if isinstance(prefix, str) else tuple(prefix)
+    _command_prefixes = tuple(sorted(prefixes, key=len, reverse=True))
+
+
+def _match_prefix(content: str) -> Optional[str]:
+    """Get the configured command prefix that content starts with, if any."""
+    for prefix in _command_prefixes:
+        if content.startswith(prefix):
+            return prefix
+    return None
+
+
+def split_command(content: str, prefix: Optional[str] = None) -> List[str]:
     """
     Split a command message into parts.
     
     Args:
         content: Message content
-        prefix: Command prefix
+        prefix: Command prefix (default: whichever configured prefix the content starts with)
         
     Returns:
         List of command parts
     """
+    if prefix is None:
+        prefix = _match_prefix(content)
+        if prefix is None:
+            return []
+    return list(_split_cached(content, prefix))
+
+
+@lru_cache(maxsize=256)
+def _split_cached(content: str, prefix: str) -> Tuple[str, ...]:
+    """
+    Memoized tokenizer behind split_command/arg_substr.
+    
+    Handlers commonly pull several arguments out of the same message, so the
+    split result for recent messages is kept rather than recomputed per call.
+    """
     if not content.startswith(prefix):
-        return []
+        return ()
     
-    content = content[len(prefix):].strip()
-    return content.split()
+    return tuple(content[len(prefix):].split())
 
 
 def arg_substr(content: str, index: int, length: Optional[int] = None) -> Optional[str]:
@@ -39,7 +93,12 @@ def arg_substr(content: str, index: int, length: Optional[int] = None) -> Option
     Returns:
         Substring or None
     """
-    parts = split_command(content)
+    prefix = _match_prefix(content)
+    if prefix is None:
+        return None
+    
+    # Every call on the same message shares one cached split and slices it
+    parts = _split_cached(content, prefix)
     if index >= len(parts):
         return None
     
@@ -52,6 +111,53 @@ def arg_substr(content: str, index: int, length: Optional[int] = None) -> Option
     return " ".join(parts[index:index + length])
 
 
+def pack_lines(lines: List[str], limit: int = 2000) -> List[str]:
+    """
+    Pack lines into newline-joined chunks no longer than a message length limit.
+    
+    Lines are kept whole where possible; only a single line longer than the
+    limit is cut. Blank lines at the start of a chunk are dropped, and a chunk
+    is only emitted if it has visible text, since Discord rejects empty messages.
+    
+    Args:
+        lines: Lines of text to send
+        limit: Maximum chunk length (default: Discord's 2000 character limit)
+        
+    Returns:
+        List of non-blank chunks, in order
+    """
+    chunks = []
+    current = []
+    current_len = -1  # No newline before the first line
+    for line in lines:
+        if current_len + 1 + len(line) > limit:
+            _append_chunk(chunks, current)
+            current, current_len = [], -1
+        
+        if not current and not line.strip():
+            continue
+        
+        if len(line) > limit:
+            # Emit whole limit-sized pieces, keeping the (non-empty) tail as the line
+            cut = (len(line) - 1) // limit * limit
+            for i in range(0, cut, limit):
+                _append_chunk(chunks, [line[i:i + limit]])
+            line = line[cut:]
+        
+        current.append(line)
+        current_len += 1 + len(line)
+    
+    _append_chunk(chunks, current)
+    return chunks
+
+
+def _append_chunk(chunks: List[str], lines: List[str]) -> None:
+    """Join lines into a chunk and append it, unless it would be blank."""
+    text = "\n".join(lines)
+    if text.strip():
+        chunks.append(text)
+
+
 def format_bytes(bytes: int) -> str:
     """
     Format bytes into human-readable string.
@@ -62,14 +168,12 @@ def format_bytes(bytes: int) -> str:
     Returns:
         Formatted string (e.g., "1.5 MiB")
     """
-    units = ["bytes", "KiB", "MiB", "GiB", "TiB", "PiB", "EiB", "ZiB", "YiB"]
+    if bytes < 1024:
+        return f"{bytes:.2f} {_BYTE_UNITS[0]}"
     
-    for i, unit in enumerate(units):
-        value = bytes / (1024 ** i)
-        if value < 1024 or i == len(units) - 1:
-            return f"{value:.2f} {unit}"
-    
-    return f"{bytes} bytes"
+    # Each unit is 2**10 times the previous one, so the bit length picks the unit directly
+    i = min((int(bytes).bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    return f"{bytes / (1 << (10 * i)):.2f} {_BYTE_UNITS[i]}"
 
 
 def emoji_hash(text: str, length: int = 8) -> str:
@@ -83,24 +187,12 @@ def emoji_hash(text: str, length: int = 8) -> str:
     Returns:
         String of emojis representing the hash
     """
-    emoji_list = [
-        "🔴", "🟠", "🟡", "🟢", "🔵", "🟣", "🟤", "⚪", "🟥",
-        "🟧", "🟨", "🟩", "🟦", "🟪", "🟫", "⬜", "🔶", "🔷",
-        "🔸", "🔹", "🔺", "🔻", "💠", "🔘", "🔳", "🔲", "❤️",
-        "♾️", "💯", "💢", "💨", "🔢", "0️⃣", "1️⃣", "2️⃣", "3️⃣",
-        "4️⃣", "5️⃣", "6️⃣", "7️⃣", "8️⃣", "9️⃣", "⭐", "✨", "💫",
-        "🔥", "💧", "🌊", "☀️", "🌙", "💀", "💎", "🎯", "🎲"
-    ]
-    
-    # Hash the input string
-    hash_obj = hashlib.sha256(text.encode('utf-8'))
-    hash_bytes = hash_obj.digest()
+    # Hash the input string. This must stay SHA-256: hashes are compared against
+    # ones posted in earlier messages, and shorter hashes are prefixes of longer ones
+    hash_bytes = hashlib.sha256(text.encode('utf-8')).digest()
+    if length > len(hash_bytes):
+        # Repeat the digest to cover longer hashes
+        hash_bytes = hash_bytes * (length // len(hash_bytes) + 1)
     
     # Map hash bytes to emojis
-    emoji_string = ""
-    for i in range(length):
-        byte_index = hash_bytes[i % len(hash_bytes)]
-        emoji_index = byte_index % len(emoji_list)
-        emoji_string += emoji_list[emoji_index]
-    
-    return emoji_string
+    return "".join([_EMOJIS[b % _EMOJI_COUNT] for b in hash_bytes[:length]])
@@ -6,8 +6,75 @@ Logging setup for Artemis
 
 import logging
 import sys
+import threading
+import time
+from logging.handlers import RotatingFileHandler
 from typing import Optional
 
+# Log file rotation and buffering settings
+_LOG_MAX_BYTES = 10 * 1024 * 1024
+_LOG_BACKUP_COUNT = 3
+_LOG_BUFFER_SIZE = 64 * 1024
+_LOG_FLUSH_INTERVAL = 1.0
+
+
+class _BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    Rotating file handler that lets a large write buffer absorb chatty logging.
+    
+    StreamHandler flushes after every record; here the buffer is flushed at most
+    once per flush interval, or immediately for warnings and errors. A record
+    that arrives inside the interval arms a one-shot timer, so buffered lines
+    still reach the file within the interval when logging goes quiet.
+    """
+    
+    _last_flush = 0.0
+    _flush_timer: Optional[threading.Timer] = None  # Pending deferred flush, if any
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=_LOG_BUFFER_SIZE,
+                    encoding=self.encoding, errors=self.errors)
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        if record.levelno >= logging.WARNING:
+            self._last_flush = 0.0  # Force the flush emit() ends with
+        super().emit(record)
+    
+    def flush(self) -> None:
+        now = time.monotonic()
+        wait = self._last_flush + _LOG_FLUSH_INTERVAL - now
+        if wait <= 0:
+            self._last_flush = now
+            super().flush()
+        elif self._flush_timer is None:
+            timer = threading.Timer(wait, self._timed_flush)
+            timer.daemon = True
+            self._flush_timer = timer
+            timer.start()
+    
+    def _timed_flush(self) -> None:
+        """Timer callback: flush whatever was buffered since the last flush."""
+        self.acquire()
+        try:
+            self._flush_timer = None
+            self._last_flush = 0.0
+            self.flush()
+        finally:
+            self.release()
+    
+    def close(self) -> None:
+        self.acquire()
+        try:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            # Whatever is still buffered goes out before the stream closes
+            self._last_flush = 0.0
+            self.flush()
+        finally:
+            self.release()
+        super().close()
+
 
 def setup_logging(level: str = "INFO", log_file: Optional[str] = None) -> None:
     """
@@ -17,6 +84,12 @@ def setup_logging(level: str = "INFO", log_file: Optional[str] = None) -> None:
         level: Log level (DEBUG, INFO, WARNING, ERROR)
         log_file: Optional path to log file
     """
+    root_logger = logging.getLogger("artemis")
+    
+    # Only configure once; repeated calls would stack duplicate handlers
+    if getattr(root_logger, "_artemis_configured", False):
+        return
+    
     # Convert string level to logging constant
     log_level = getattr(logging, level.upper(), logging.INFO)
     
@@ -31,15 +104,17 @@ def setup_logging(level: str = "INFO", log_file: Optional[str] = None) -> None:
     console_handler.setLevel(log_level)
     
     # Root logger
-    root_logger = logging.getLogger("artemis")
     root_logger.setLevel(log_level)
     root_logger.addHandler(console_handler)
     
     # File handler if specified
     if log_file:
-        file_handler = logging.FileHandler(log_file)
+        file_handler = _BufferedRotatingFileHandler(
+            log_file, maxBytes=_LOG_MAX_BYTES, backupCount=_LOG_BACKUP_COUNT, encoding='utf-8'
+        )
         file_handler.setFormatter(formatter)
         file_handler.setLevel(log_level)
         root_logger.addHandler(file_handler)
     
     logging.getLogger("disnake").setLevel(logging.WARNING)
+    root_logger._artemis_configured = True
@@ -19,7 +19,7 @@ ADMIN_USER_IDS = [
 # Storage directory
 STORAGE_DIR = "storage"
 
-# Command prefix
+# Command prefix (a string, or a list of strings to accept several prefixes)
 COMMAND_PREFIX = "!"
 
 # Testing mode (disables certain features)
@@ -19,12 +19,15 @@ Features:
     - Provides detailed vote breakdowns with voter names
 """
 
+import asyncio
 import logging
 import disnake
+from collections import Counter, defaultdict
 from datetime import datetime
 
 from artemis.plugin.base import PluginInterface, PluginHelper
 from artemis.events.listener import EventListener
+from artemis.utils.helpers import pack_lines
 
 logger = logging.getLogger("artemis.plugin.agenda")
 
@@ -44,6 +47,20 @@ class Agenda(PluginInterface, PluginHelper):
         },
     }
     
+    # CONF_TPL is static, so its values are resolved once here rather than per command
+    _STAFF_ROLE = CONF_TPL['staffRole']
+    _TIEBREAKER_ROLE = CONF_TPL['tiebreakerRole']
+    _QUORUM = CONF_TPL['quorum']
+    _VOTE_NAMES = tuple(CONF_TPL['voteTypes'])
+    _VOTE_RANK = {vote_name: rank for rank, vote_name in enumerate(_VOTE_NAMES)}
+    
+    # Reaction key (custom emoji id or unicode emoji, as a string) -> vote type
+    _EMOJI_TO_VOTE = {
+        str(vote_id): vote_name
+        for vote_name, vote_id in CONF_TPL['voteTypes'].items()
+        if vote_id is not None
+    }
+    
     @staticmethod
     def register(bot):
         """Register the plugin."""
@@ -58,12 +75,15 @@ class Agenda(PluginInterface, PluginHelper):
             .set_help("**Usage**: `!agenda <message_url_or_id>`\n\nTally votes from a message with reactions. Counts votes from staff members based on configured vote types (For, Against, Abstain, Absent) and provides a detailed breakdown including quorum status.")
         )
     
+    @staticmethod
+    async def _reaction_staff_ids(reaction, staff_ids: set) -> list:
+        """Fetch the IDs of the staff members who added a reaction."""
+        return [user.id async for user in reaction.users() if user.id in staff_ids]
+    
     @staticmethod
     async def agenda_tally_handler(data):
         """Handle agenda tally command."""
         try:
-            config = Agenda.CONF_TPL.copy()
-            
             msg_ref = Agenda.arg_substr(data.message.content, 1, 1)
             if not msg_ref:
                 await data.message.reply("Usage: `!agenda <message_url_or_id>`")
@@ -74,43 +94,43 @@ class Agenda(PluginInterface, PluginHelper):
                 await data.message.reply("Could not find that message.")
                 return
             
-            import_msg = await data.message.channel.fetch_message(import_msg.id)
-            
-            staff_role_id = config.get('staffRole', 0)
-            staff_members = {}
+            staff_role_id = Agenda._STAFF_ROLE
+            staff_ids = set()
             if staff_role_id:
                 staff_role = data.guild.get_role(staff_role_id)
                 if staff_role:
-                    for member in data.guild.members:
-                        if staff_role in member.roles:
-                            staff_members[member.id] = None
-            
-            vote_types = config.get('voteTypes', {})
-            vote_counts = {vote_type: [] for vote_type in vote_types.keys()}
+                    staff_ids = {member.id for member in staff_role.members}
             
+            vote_reactions = []
             for reaction in import_msg.reactions:
-                emoji_id = reaction.emoji.id if hasattr(reaction.emoji, 'id') else str(reaction.emoji)
-                users = [user async for user in reaction.users()]
-                
-                vote_type = None
-                for vt_name, vt_id in vote_types.items():
-                    if str(vt_id) == str(emoji_id) or (isinstance(vt_id, str) and vt_id == str(reaction.emoji)):
-                        vote_type = vt_name
-                        break
-                
-                if vote_type:
-                    for user in users:
-                        if user.id in staff_members:
-                            staff_members[user.id] = vote_type
-            
-            total_staff = len(staff_members)
-            present = sum(1 for v in staff_members.values() if v is not None)
-            
-            for member_id, vote_type in staff_members.items():
+                emoji = reaction.emoji
+                emoji_id = getattr(emoji, 'id', None)
+                vote_type = Agenda._EMOJI_TO_VOTE.get(str(emoji_id) if emoji_id else str(emoji))
                 if vote_type:
-                    vote_counts[vote_type].append(member_id)
-            
-            totals = {vt: len(vote_counts[vt]) for vt in vote_types.keys()}
+                    vote_reactions.append((reaction, vote_type))
+            
+            # Process reactions in configured vote-type order (For, Against, ...)
+            vote_reactions.sort(key=lambda item: Agenda._VOTE_RANK[item[1]])
+            
+            # Fetch every vote reaction's staff reactors concurrently
+            reactor_ids = await asyncio.gather(
+                *(Agenda._reaction_staff_ids(reaction, staff_ids) for reaction, _ in vote_reactions)
+            )
+            
+            # A staff member who reacted with several vote emojis is counted once,
+            # for the highest-priority vote type
+            staff_vote = {}  # Staff member ID -> vote type, only for staff who voted
+            totals = Counter()
+            voters_by_type = defaultdict(list)
+            for (_, vote_type), user_ids in zip(vote_reactions, reactor_ids):
+                for user_id in user_ids:
+                    if user_id not in staff_vote:
+                        staff_vote[user_id] = vote_type
+                        totals[vote_type] += 1
+                        voters_by_type[vote_type].append(user_id)
+            
+            total_staff = len(staff_ids)
+            present = len(staff_vote)
             
             resp = []
             resp.append(f"__**{data.guild.name} - Staff Motion Results**__")
@@ -119,7 +139,7 @@ class Agenda(PluginInterface, PluginHelper):
             resp.append("")
             
             qstr = f"{present}/{total_staff} staff voting ({present/total_staff*100:.1f}%)"
-            if present >= total_staff * config['quorum']:
+            if present >= total_staff * Agenda._QUORUM:
                 resp.append(f"Quorum is present with {qstr}")
             else:
                 resp.append(f"Quorum not present with {qstr}")
@@ -128,23 +148,24 @@ class Agenda(PluginInterface, PluginHelper):
             resp.append(f"> {import_msg.content[:500]}")
             resp.append("")
             
-            for vote_type in vote_types.keys():
-                count = totals[vote_type]
-                voters = [data.guild.get_member(uid) for uid in vote_counts[vote_type]]
-                voter_names = ", ".join([v.display_name for v in voters if v])
-                resp.append(f"*{vote_type}*: {count} ({voter_names})")
+            get_member = data.guild.get_member
+            resp.extend(
+                f"*{vote_type}*: {totals[vote_type]} "
+                f"({', '.join(m.display_name for uid in voters_by_type[vote_type] if (m := get_member(uid)))})"
+                for vote_type in Agenda._VOTE_NAMES
+            )
             
             if totals['For'] > totals['Against']:
                 resp.append("**Motion passes**")
                 copyres = "Passed"
             elif totals['For'] == totals['Against']:
-                tiebreaker_role_id = config.get('tiebreakerRole', 0)
+                tiebreaker_role_id = Agenda._TIEBREAKER_ROLE
                 if tiebreaker_role_id:
                     tiebreaker_role = data.guild.get_role(tiebreaker_role_id)
                     if tiebreaker_role:
-                        tiebreaker = next((m for m in data.guild.members if tiebreaker_role in m.roles), None)
-                        if tiebreaker and tiebreaker.id in staff_members:
-                            tiebreaker_vote = staff_members[tiebreaker.id]
+                        tiebreaker = next(iter(tiebreaker_role.members), None)
+                        if tiebreaker and tiebreaker.id in staff_ids:
+                            tiebreaker_vote = staff_vote.get(tiebreaker.id)
                             if tiebreaker_vote == 'For':
                                 resp.append("**Motion passes**")
                                 copyres = "Passed"
@@ -176,12 +197,8 @@ class Agenda(PluginInterface, PluginHelper):
             resp.append(import_msg.content[:500])
             resp.append("```")
             
-            response_text = "\n".join(resp)
-            if len(response_text) > 2000:
-                chunks = [response_text[i:i+2000] for i in range(0, len(response_text), 2000)]
-                for chunk in chunks:
-                    await data.message.channel.send(chunk)
-            else:
-                await data.message.channel.send(response_text)
+            # Split on line boundaries so markdown (e.g. the code block) isn't cut mid-token
+            for chunk in pack_lines(resp):
+                await data.message.channel.send(chunk)
         except Exception as e:
             await Agenda.exception_handler(data.message, e, True)
@@ -5,7 +5,7 @@ Archive Plugin - Channel archiving tool
 
 This plugin allows administrators to archive entire Discord channels to JSON files.
 It captures all messages, attachments, user information, and metadata, storing them
-in a structured format. Large archives are automatically compressed with gzip.
+in a structured format. Archives are written as gzip-compressed JSON.
 
 Commands:
     !archive <channel_mention> - Archive a channel (admin only)
@@ -15,14 +15,15 @@ Features:
     - Preserves message metadata (author, timestamps, edits, pins)
     - Captures attachment URLs and metadata
     - Stores user information and avatars
-    - Automatically compresses large archives
+    - Streams archives straight to a gzip file
     - Admin-only due to resource usage
 """
 
+import asyncio
 import logging
 import disnake
-import json
 import gzip
+import orjson
 from datetime import datetime
 from pathlib import Path
 
@@ -31,12 +32,22 @@ from artemis.events.listener import EventListener
 
 logger = logging.getLogger("artemis.plugin.archive")
 
+# Shared placeholder for messages without embeds/attachments (serializes as [])
+_EMPTY = ()
+
 
 class Archive(PluginInterface, PluginHelper):
     """Archive plugin for channel archiving."""
     
     ARCHIVER_VERSION = "1.0.0"
     
+    # Messages fetched ahead of serialization
+    FETCH_QUEUE_SIZE = 1024
+    # Serialized bytes handed to the compression thread at a time
+    WRITE_BATCH_SIZE = 256 * 1024
+    # zlib's default level; gzip.open's default of 9 is much slower for little gain on JSON
+    COMPRESS_LEVEL = 6
+    
     @staticmethod
     def register(bot):
         """Register the plugin."""
@@ -55,8 +66,7 @@ class Archive(PluginInterface, PluginHelper):
     async def archive(data):
         """Handle archive command."""
         try:
-            admin_ids = getattr(data.artemis.config, 'ADMIN_USER_IDS', [])
-            if str(data.message.author.id) not in admin_ids:
+            if data.message.author.id not in data.artemis.admin_ids:
                 await Archive.unauthorized(data.message)
                 return
             
@@ -70,26 +80,149 @@ class Archive(PluginInterface, PluginHelper):
                 await data.message.reply("Could not find that channel.")
                 return
             
-            if not channel.permissions_for(data.guild.me).view_channel:
-                await data.message.channel.send("I don't have read access to that channel!")
-                return
-            
             await data.message.channel.send(f"Beginning {channel.mention} (`#{channel.name}`) archival...")
             await Archive._archive(channel, data)
         except Exception as e:
             await Archive.exception_handler(data.message, e)
     
     @staticmethod
-    async def _archive(channel: disnake.TextChannel, data):
-        """Archive channel messages."""
+    async def _fetch_history(channel: disnake.TextChannel, queue: asyncio.Queue):
+        """
+        Feed a channel's history into a queue, oldest first.
+        
+        The queue ends with None, or with the exception that stopped the fetch.
+        """
         try:
-            messages = []
-            async for message in channel.history(limit=None):
-                messages.append(message)
+            async for message in channel.history(limit=None, oldest_first=True):
+                await queue.put(message)
+        except Exception as e:
+            await queue.put(e)
+            return
+        await queue.put(None)
+    
+    @staticmethod
+    async def _write_archive(file_path: Path, header: dict, queue: asyncio.Queue) -> int:
+        """
+        Serialize queued messages into a gzip-compressed JSON archive.
+        
+        Messages are serialized as they come off the queue and written in batches,
+        so neither the message list nor the full JSON document is ever held in
+        memory. urls/users/pins are small and are written after the messages.
+        Compression runs in a worker thread so it doesn't block the event loop.
+        
+        Args:
+            file_path: Archive file to create
+            header: Top-level archive fields written before the messages
+            queue: Queue fed by _fetch_history
             
-            messages.sort(key=lambda m: m.id)
+        Returns:
+            Number of messages archived
+        """
+        urls = {}  # Snowflake ID (int; written as a string key) -> URL
+        users_by_id = {}  # Author ID -> (tag, nick, avatar URL, is webhook)
+        pins = []
+        message_count = 0
+        
+        loop = asyncio.get_running_loop()
+        f = gzip.open(file_path, 'wb', compresslevel=Archive.COMPRESS_LEVEL)
+        pending = None  # Write of the previous batch, running in a worker thread
+        batch = [orjson.dumps(header)[:-1], b',"messages":[']
+        batch_size = 0
+        try:
+            while True:
+                message = await queue.get()
+                if message is None:
+                    break
+                if isinstance(message, Exception):
+                    raise message
+                
+                author = message.author
+                embeds = message.embeds
+                attachments = message.attachments
+                msg_data = {
+                    "id": message.id,
+                    "author": author.id,
+                    "content": message.content,
+                    "edited": message.edited_at.isoformat() if message.edited_at else None,
+                    "created": message.created_at.isoformat() if message.created_at else None,
+                    "attachments": _EMPTY,
+                    "embeds": [embed.to_dict() for embed in embeds] if embeds else _EMPTY
+                }
+                
+                if message.webhook_id:
+                    msg_data["webhookName"] = author.name
+                
+                if message.pinned:
+                    pins.append(message.id)
+                
+                if attachments:
+                    urls.update({att.id: att.url for att in attachments})
+                    msg_data["attachments"] = [
+                        {
+                            "id": att.id,
+                            "filename": att.filename,
+                            "size": att.size,
+                            "url": att.url,
+                            "proxy_url": att.proxy_url,
+                            "content_type": att.content_type
+                        }
+                        for att in attachments
+                    ]
+                
+                if author.id not in users_by_id:
+                    avatar = author.display_avatar
+                    avatar_url = avatar.url if avatar else None
+                    users_by_id[author.id] = (
+                        str(author),
+                        getattr(author, 'display_name', author.name),
+                        avatar_url,
+                        bool(message.webhook_id)
+                    )
+                    if avatar_url:
+                        urls[author.id] = avatar_url
+                
+                if message_count:
+                    batch.append(b',')
+                encoded = orjson.dumps(msg_data)
+                batch.append(encoded)
+                batch_size += len(encoded)
+                message_count += 1
+                
+                if batch_size >= Archive.WRITE_BATCH_SIZE:
+                    # Serialize the next batch while this one is compressed
+                    if pending:
+                        await pending
+                    pending = loop.run_in_executor(None, f.write, b"".join(batch))
+                    batch = []
+                    batch_size = 0
             
-            payload = {
+            users = {
+                str(user_id): {"id": user_id, "tag": tag, "nick": nick, "av": av, "webhook": webhook}
+                for user_id, (tag, nick, av, webhook) in users_by_id.items()
+            }
+            batch.extend((
+                b'],"urls":', orjson.dumps(urls, option=orjson.OPT_NON_STR_KEYS),
+                b',"users":', orjson.dumps(users),
+                b',"pins":', orjson.dumps(pins),
+                b'}'
+            ))
+            if pending:
+                await pending
+            pending = loop.run_in_executor(None, f.write, b"".join(batch))
+            await pending
+        finally:
+            # Never close the file under a write that is still running
+            if pending and not pending.done():
+                await asyncio.wait([pending])
+            await loop.run_in_executor(None, f.close)
+        
+        return message_count
+    
+    @staticmethod
+    async def _archive(channel: disnake.TextChannel, data):
+        """Archive channel messages."""
+        try:
+            header = {
                 "_version": Archive.ARCHIVER_VERSION,
                 "_retrieval": {
                     "time": datetime.utcnow().isoformat(),
@@ -103,72 +236,33 @@ class Archive(PluginInterface, PluginHelper):
                     "topic": channel.topic,
                     "isNSFW": channel.nsfw,
                     "created": channel.created_at.isoformat() if channel.created_at else None
-                },
-                "urls": {},
-                "users": {},
-                "pins": [],
-                "messages": []
-            }
-            
-            for message in messages:
-                msg_data = {
-                    "id": message.id,
-                    "author": message.author.id,
-                    "content": message.content,
-                    "edited": message.edited_at.isoformat() if message.edited_at else None,
-                    "created": message.created_at.isoformat() if message.created_at else None,
-                    "attachments": [],
-                    "embeds": [embed.to_dict() for embed in message.embeds]
                 }
-                
-                if message.webhook_id:
-                    msg_data["webhookName"] = message.author.name
-                
-                if message.pinned:
-                    payload["pins"].append(message.id)
-                
-                for att in message.attachments:
-                    payload["urls"][str(att.id)] = att.url
-                    msg_data["attachments"].append({
-                        "id": att.id,
-                        "filename": att.filename,
-                        "size": att.size,
-                        "url": att.url,
-                        "proxy_url": att.proxy_url,
-                        "content_type": att.content_type
-                    })
-                
-                if str(message.author.id) not in payload["users"]:
-                    payload["users"][str(message.author.id)] = {
-                        "id": message.author.id,
-                        "tag": str(message.author),
-                        "nick": getattr(message.author, 'display_name', message.author.name),
-                        "av": message.author.display_avatar.url if message.author.display_avatar else None,
-                        "webhook": bool(message.webhook_id)
-                    }
-                    if message.author.display_avatar:
-                        payload["urls"][str(message.author.id)] = message.author.display_avatar.url
-                
-                payload["messages"].append(msg_data)
+            }
             
-            json_data = json.dumps(payload, indent=2, ensure_ascii=False)
             fname = f"{channel.id}_{channel.name}.json"
             
             temp_dir = Path("temp")
             temp_dir.mkdir(exist_ok=True)
+            file_path = temp_dir / f"{fname}.gz"
             
-            file_path = temp_dir / fname
-            if len(json_data.encode('utf-8')) > (2 ** 20):  # 1MB
-                file_path = temp_dir / f"{fname}.gz"
-                with gzip.open(file_path, 'wb') as f:
-                    f.write(json_data.encode('utf-8'))
-            else:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(json_data)
+            # Fetching runs in its own task so the next history page is requested
+            # while earlier messages are still being serialized
+            queue = asyncio.Queue(maxsize=Archive.FETCH_QUEUE_SIZE)
+            fetcher = asyncio.create_task(Archive._fetch_history(channel, queue))
+            try:
+                message_count = await Archive._write_archive(file_path, header, queue)
+            except disnake.Forbidden:
+                # Read access is checked by the history request itself rather
+                # than by computing the bot's channel permissions up front
+                file_path.unlink(missing_ok=True)
+                await data.message.channel.send("I don't have read access to that channel!")
+                return
+            finally:
+                fetcher.cancel()
             
             try:
-                file_obj = disnake.File(str(file_path), filename=fname if not file_path.suffix == '.gz' else f"{fname}.gz")
-                await data.message.channel.send(f"Done! {len(messages)} messages saved.", file=file_obj)
+                file_obj = disnake.File(str(file_path), filename=f"{fname}.gz")
+                await data.message.channel.send(f"Done! {message_count} messages saved.", file=file_obj)
             except Exception as e:
                 await data.message.channel.send(f"Done! Upload failed but you can grab it from {file_path.absolute()}")
         except Exception as e:
@@ -24,6 +24,7 @@ import logging
 import disnake
 from disnake import Embed
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, Dict, Any
 
 from artemis.plugin.base import PluginInterface, PluginHelper
@@ -33,6 +34,36 @@ from artemis.utils.helpers import emoji_hash
 logger = logging.getLogger("artemis.plugin.auditlog")
 
 
+@lru_cache(maxsize=None)
+def _action_color(action_name: str) -> int:
+    """
+    Get the embed color for an audit log action.
+    
+    There are only a few dozen action types, so each name's color is worked out once.
+    
+    Args:
+        action_name: Lowercased audit log action name
+        
+    Returns:
+        Embed color for the action
+    """
+    if 'ban' in action_name or 'kick' in action_name or 'prune' in action_name:
+        return 0xe74c3c  # Red for bans/kicks
+    if 'unban' in action_name or 'welcome' in action_name:
+        return 0x2ecc71  # Green for unbans/welcomes
+    if 'role' in action_name or 'permission' in action_name:
+        return 0xf39c12  # Orange for role/permission changes
+    if 'channel' in action_name or 'overwrite' in action_name:
+        return 0x9b59b6  # Purple for channel changes
+    if 'update' in action_name or 'change' in action_name:
+        return 0x3498db  # Blue for updates
+    if 'delete' in action_name:
+        return 0xe67e22  # Dark orange for deletions
+    if 'create' in action_name:
+        return 0x1abc9c  # Teal for creations
+    return 0x3498db
+
+
 class AuditLog(PluginInterface, PluginHelper):
     """Audit log monitoring plugin."""
     
@@ -77,8 +108,7 @@ class AuditLog(PluginInterface, PluginHelper):
     async def config(data):
         """Handle auditlog config command."""
         try:
-            admin_ids = getattr(data.artemis.config, 'ADMIN_USER_IDS', [])
-            if str(data.message.author.id) not in admin_ids:
+            if data.message.author.id not in data.artemis.admin_ids:
                 await AuditLog.unauthorized(data.message)
                 return
             
@@ -110,20 +140,29 @@ class AuditLog(PluginInterface, PluginHelper):
         try:
             storage = guild._state._get_client().storage if hasattr(guild._state, '_get_client') else None
             if storage:
-                info = await storage.get("auditlog", str(guild.id))
+                key = str(guild.id)
+                info = await storage.get("auditlog", key)
                 event_counter = info.get("event_counter", 0) if isinstance(info, dict) else 0
                 
-                await storage.set("auditlog", str(guild.id), {
-                    "guild_id": str(guild.id),
-                    "channel_id": str(channel.id),
+                # IDs are stored as JSON numbers; only the namespace key has to be a string
+                await storage.set("auditlog", key, {
+                    "guild_id": guild.id,
+                    "channel_id": channel.id,
                     "event_counter": event_counter
                 })
         except Exception as e:
             logger.error(f"Failed to set audit log channel: {e}")
     
     @staticmethod
-    async def get_and_increment_event_counter(guild: disnake.Guild, bot) -> int:
-        """Get the current event counter and increment it for the next event."""
+    async def get_and_increment_event_counter(guild: disnake.Guild, bot, info: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Get the current event counter and increment it for the next event.
+        
+        Args:
+            guild: Guild the event belongs to
+            bot: Bot instance
+            info: The guild's audit log info if the caller already read it, saving a storage read
+        """
         try:
             storage = bot.storage if bot and hasattr(bot, 'storage') else None
             if not storage:
@@ -132,15 +171,17 @@ class AuditLog(PluginInterface, PluginHelper):
             if not storage:
                 return 1
             
-            info = await storage.get("auditlog", str(guild.id))
+            key = str(guild.id)
+            if info is None:
+                info = await storage.get("auditlog", key)
             if not info or not isinstance(info, dict):
                 event_counter = 1
-                info = {"guild_id": str(guild.id), "event_counter": event_counter}
+                info = {"guild_id": guild.id, "event_counter": event_counter}
             else:
                 event_counter = info.get("event_counter", 0) + 1
                 info["event_counter"] = event_counter
             
-            await storage.set("auditlog", str(guild.id), info)
+            await storage.set("auditlog", key, info)
             return event_counter
         except Exception as e:
             logger.error(f"Failed to get/increment event counter for guild {guild.id}: {e}")
@@ -150,68 +191,66 @@ class AuditLog(PluginInterface, PluginHelper):
     async def handle_audit_log_entry(bot, entry: disnake.AuditLogEntry):
         """Handle a new audit log entry from the gateway event."""
         try:
-            if not entry.guild:
+            guild = entry.guild
+            if not guild:
                 return
             
             action_name = entry.action.name.lower()
             if 'invite' in action_name and 'create' in action_name:
                 return
             
-            if entry.user and entry.user.id == bot.user.id:
+            user = entry.user
+            if user and user.id == bot.user.id:
                 if 'channel' in action_name and ('update' in action_name or 'change' in action_name):
-                    if entry.target and isinstance(entry.target, disnake.VoiceChannel):
+                    if isinstance(entry.target, disnake.VoiceChannel):
                         if entry.after:
                             for key, value in entry.after:
                                 if key == 'name':
                                     return  # Skip voice channel name changes by Artemis
             
-            info = await AuditLog.get_info(entry.guild, bot)
+            info = await AuditLog.get_info(guild, bot)
             if not info or not info.get("channel_id"):
                 return
             
-            channel = entry.guild.get_channel(int(info["channel_id"]))
+            channel = guild.get_channel(int(info["channel_id"]))
             if not channel:
                 return
             
-            event_number = await AuditLog.get_and_increment_event_counter(entry.guild, bot)
+            event_number = await AuditLog.get_and_increment_event_counter(guild, bot, info)
             
-            event_time = entry.created_at if entry.created_at else datetime.now()
-            event_time_str = event_time.isoformat()
-            hash_input = f"{event_number}:{event_time_str}"
-            event_hash = emoji_hash(hash_input)
+            # Read the clock at most once per entry and share it with the embed
+            event_time = entry.created_at or disnake.utils.utcnow()
+            event_hash = emoji_hash(f"{event_number}:{event_time.isoformat()}")
             
-            embed = AuditLog.create_audit_log_embed(entry, event_number, event_hash)
+            embed = AuditLog.create_audit_log_embed(entry, event_number, event_hash, event_time, action_name)
             await channel.send(embed=embed)
             
-            logger.debug(f"Logged audit log entry {entry.id} (#{event_number}) for guild {entry.guild.name}")
+            logger.debug(f"Logged audit log entry {entry.id} (#{event_number}) for guild {guild.name}")
         except Exception as e:
             logger.error(f"Error handling audit log entry: {e}", exc_info=True)
     
     @staticmethod
-    def create_audit_log_embed(entry: disnake.AuditLogEntry, event_number: int, event_hash: str) -> Embed:
-        """Create an embed from an audit log entry."""
-        color = 0x3498db
+    def create_audit_log_embed(entry: disnake.AuditLogEntry, event_number: int, event_hash: str,
+                               event_time: Optional[datetime] = None,
+                               action_name: Optional[str] = None) -> Embed:
+        """
+        Create an embed from an audit log entry.
         
-        action_name = entry.action.name.lower()
-        if 'ban' in action_name or 'kick' in action_name or 'prune' in action_name:
-            color = 0xe74c3c  # Red for bans/kicks
-        elif 'unban' in action_name or 'welcome' in action_name:
-            color = 0x2ecc71  # Green for unbans/welcomes
-        elif 'role' in action_name or 'permission' in action_name:
-            color = 0xf39c12  # Orange for role/permission changes
-        elif 'channel' in action_name or 'overwrite' in action_name:
-            color = 0x9b59b6  # Purple for channel changes
-        elif 'update' in action_name or 'change' in action_name:
-            color = 0x3498db  # Blue for updates
-        elif 'delete' in action_name:
-            color = 0xe67e22  # Dark orange for deletions
-        elif 'create' in action_name:
-            color = 0x1abc9c  # Teal for creations
+        Args:
+            entry: Audit log entry to describe
+            event_number: Sequential event number for the guild
+            event_hash: Emoji hash of the event
+            event_time: Timestamp for the embed, defaulting to the entry's creation time
+            action_name: Lowercased action name if the caller already computed it
+        """
+        action = entry.action
+        if action_name is None:
+            action_name = action.name.lower()
         
         embed = Embed(
-            title=f"Audit Log: {entry.action.name.replace('_', ' ').title()}",
-            color=color,
-            timestamp=entry.created_at if entry.created_at else datetime.now()
+            title=f"Audit Log: {action.name.replace('_', ' ').title()}",
+            color=_action_color(action_name),
+            timestamp=event_time or entry.created_at or disnake.utils.utcnow()
         )
         
         # Event number and hash
@@ -219,30 +258,29 @@ class AuditLog(PluginInterface, PluginHelper):
         embed.add_field(name="Hash", value=event_hash, inline=True)
         
         # User who performed the action
-        if entry.user:
+        user = entry.user
+        if user:
             embed.set_author(
-                name=f"{entry.user.name}#{getattr(entry.user, 'discriminator', '')}",
-                icon_url=entry.user.display_avatar.url
+                name=f"{user.name}#{getattr(user, 'discriminator', '')}",
+                icon_url=user.display_avatar.url
             )
         
         # Target of the action
-        if entry.target:
-            target_name = "Unknown"
-            if isinstance(entry.target, disnake.Member):
-                target_name = f"{entry.target.name}#{getattr(entry.target, 'discriminator', '')}"
-            elif isinstance(entry.target, disnake.User):
-                target_name = f"{entry.target.name}#{getattr(entry.target, 'discriminator', '')}"
-            elif isinstance(entry.target, disnake.Role):
-                target_name = f"@{entry.target.name}"
-            elif isinstance(entry.target, disnake.abc.GuildChannel):
-                target_name = f"#{entry.target.name}"
-            elif hasattr(entry.target, 'name'):
-                target_name = str(entry.target.name)
+        target = entry.target
+        if target:
+            if isinstance(target, (disnake.Member, disnake.User)):
+                target_name = f"{target.name}#{getattr(target, 'discriminator', '')}"
+            elif isinstance(target, disnake.Role):
+                target_name = f"@{target.name}"
+            elif isinstance(target, disnake.abc.GuildChannel):
+                target_name = f"#{target.name}"
+            elif hasattr(target, 'name'):
+                target_name = str(target.name)
             else:
-                target_name = f"ID: {entry.target.id}"
+                target_name = f"ID: {target.id}"
             
             embed.add_field(name="Target", value=target_name, inline=True)
-            embed.add_field(name="Target ID", value=str(entry.target.id), inline=True)
+            embed.add_field(name="Target ID", value=str(target.id), inline=True)
         
         # Reason
         if entry.reason:
@@ -256,7 +294,7 @@ class AuditLog(PluginInterface, PluginHelper):
         footer_parts = [f"Event #{event_number}"]
         if entry.id:
             footer_parts.append(f"Entry ID: {entry.id}")
-        footer_parts.append(f"Action Type: {entry.action.value}")
+        footer_parts.append(f"Action Type: {action.value}")
         embed.set_footer(text=" | ".join(footer_parts))
         
         return embed
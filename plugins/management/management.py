@@ -302,8 +302,7 @@ class Management(PluginInterface, PluginHelper):
             if len(args) > 1:
                 try:
                     channel_id = int(args[1])
-                    admin_ids = getattr(data.artemis.config, 'ADMIN_USER_IDS', [])
-                    if str(data.message.author.id) not in admin_ids:
+                    if data.message.author.id not in data.artemis.admin_ids:
                         await Management.unauthorized(data.message)
                         return
                     
@@ -353,8 +352,7 @@ class Management(PluginInterface, PluginHelper):
     async def invite(data):
         """Handle invite command."""
         try:
-            admin_ids = getattr(data.artemis.config, 'ADMIN_USER_IDS', [])
-            if str(data.message.author.id) not in admin_ids:
+            if data.message.author.id not in data.artemis.admin_ids:
                 await Management.unauthorized(data.message)
                 return
             
@@ -423,8 +421,7 @@ class Management(PluginInterface, PluginHelper):
             all_commands = set(data.artemis.eventManager.command_listeners.keys())
             
             available_commands = {}
-            admin_ids = getattr(data.artemis.config, 'ADMIN_USER_IDS', [])
-            is_admin = str(data.message.author.id) in admin_ids
+            is_admin = data.message.author.id in data.artemis.admin_ids
             
             for cmd in sorted(all_commands):
                 if cmd not in command_info:
@@ -605,8 +602,7 @@ class Management(PluginInterface, PluginHelper):
             args = Management.split_command(data.message.content)
             
             if len(args) > 1 and args[1].lower() == "role":
-                admin_ids = getattr(data.artemis.config, 'ADMIN_USER_IDS', [])
-                if str(data.message.author.id) not in admin_ids:
+                if data.message.author.id not in data.artemis.admin_ids:
                     await Management.unauthorized(data.message)
                     return
                 
@@ -103,8 +103,7 @@ class MatchVoting(PluginInterface, PluginHelper):
         try:
             member = data.guild.get_member(data.message.author.id) if data.guild else None
             if not member or not member.guild_permissions.manage_roles:
-                admin_ids = getattr(data.artemis.config, 'ADMIN_USER_IDS', [])
-                if str(data.message.author.id) not in admin_ids:
+                if data.message.author.id not in data.artemis.admin_ids:
                     await MatchVoting.unauthorized(data.message)
                     return
             
@@ -146,8 +145,7 @@ class MatchVoting(PluginInterface, PluginHelper):
         try:
             member = data.guild.get_member(data.message.author.id) if data.guild else None
             if not member or not member.guild_permissions.manage_roles:
-                admin_ids = getattr(data.artemis.config, 'ADMIN_USER_IDS', [])
-                if str(data.message.author.id) not in admin_ids:
+                if data.message.author.id not in data.artemis.admin_ids:
                     await MatchVoting.unauthorized(data.message)
                     return
             
@@ -227,8 +225,7 @@ class MatchVoting(PluginInterface, PluginHelper):
     async def announce_match(data, args: list):
         """Announce a match."""
         try:
-            admin_ids = getattr(data.artemis.config, 'ADMIN_USER_IDS', [])
-            if str(data.message.author.id) not in admin_ids:
+            if data.message.author.id not in data.artemis.admin_ids:
                 await MatchVoting.unauthorized(data.message)
                 return
             
@@ -313,8 +310,7 @@ class MatchVoting(PluginInterface, PluginHelper):
             resp.append(f"Deadline: *{deadline.strftime('%Y-%m-%d %H:%M:%S UTC')}*")
             resp.append("")
             
-            admin_ids = getattr(data.artemis.config, 'ADMIN_USER_IDS', [])
-            is_admin = str(data.message.author.id) in admin_ids
+            is_admin = data.message.author.id in data.artemis.admin_ids
             
             total_votes = len(votes)
             resp.append(f"Total votes: {total_votes}")
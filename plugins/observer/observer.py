@@ -98,8 +98,7 @@ class Observer(PluginInterface, PluginHelper):
     async def config(data):
         """Handle observer config command."""
         try:
-            admin_ids = getattr(data.artemis.config, 'ADMIN_USER_IDS', [])
-            if str(data.message.author.id) not in admin_ids:
+            if data.message.author.id not in data.artemis.admin_ids:
                 await Observer.unauthorized(data.message)
                 return
             
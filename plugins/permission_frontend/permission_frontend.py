@@ -163,8 +163,7 @@ class PermissionFrontend(PluginInterface, PluginHelper):
                 await data.message.reply("Cannot determine user information.")
                 return
             
-            admin_ids = getattr(data.artemis.config, 'ADMIN_USER_IDS', [])
-            is_admin = str(data.message.author.id) in admin_ids
+            is_admin = data.message.author.id in data.artemis.admin_ids
             
             all_perms = await data.artemis.storage.get_all("permissions")
             
@@ -515,8 +514,7 @@ class PermissionFrontend(PluginInterface, PluginHelper):
     @staticmethod
     async def has_permission_permission(setting: int, target: int, data) -> bool:
         """Check if user can modify permissions."""
-        admin_ids = getattr(data.artemis.config, 'ADMIN_USER_IDS', [])
-        is_admin = str(data.message.author.id) in admin_ids
+        is_admin = data.message.author.id in data.artemis.admin_ids
         
         if setting == PermissionFrontend.SETTING_GLOBAL or target == PermissionFrontend.TARGET_BOTADMIN:
             return is_admin
@@ -0,0 +1,27 @@
+"""
+Copyright 2025, Vijay Challa - Use of this source code follows the MIT license found in the LICENSE file.
+
+Tests for artemis.utils.helpers
+"""
+
+from artemis.utils.helpers import pack_lines
+
+
+def test_pack_lines_never_emits_blank_chunks():
+    """Blank lines before an oversize line must not become a chunk of their own."""
+    chunks = pack_lines(["", "", "x" * 2001])
+
+    assert chunks == ["x" * 2000, "x"]
+
+
+def test_pack_lines_drops_blank_lines_at_chunk_start():
+    """Blank lines that spill over a chunk boundary are not carried into the next chunk."""
+    chunks = pack_lines(["a" * 1999, "", "", "b"])
+
+    assert len(chunks) == 2
+    assert chunks[1] == "b"
+
+
+def test_pack_lines_keeps_inner_blank_lines():
+    """Blank lines between text in the same chunk are preserved."""
+    assert pack_lines(["a", "", "b"]) == ["a\n\nb"]